@@ -0,0 +1,101 @@
+"""Concurrent identical requests against the local fake MMOBomb share one upstream call.
+
+Starts N callers at once for the same /games list, the same /game id (cold
+and revalidating) and checks each wave costs exactly one upstream request.
+Also cancels callers mid-flight: the others still get the result, and a
+caller arriving after everyone else gave up joins the same request.
+Exits non-zero if any check fails.
+
+    python -m benchmarks.coalescing --callers 20 --latency 50
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from typing import List
+
+from benchmarks.fake_mmobomb import FakeMMOBomb, generate_catalog
+
+
+def check(failures: List[str], ok: bool, message: str):
+    print(f"{'ok  ' if ok else 'FAIL'} {message}")
+    if not ok:
+        failures.append(message)
+
+
+async def run(args) -> List[str]:
+    server = FakeMMOBomb(generate_catalog(args.games), latency=args.latency / 1000)
+    await server.start()
+    os.environ["DETAIL_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="bench-"), "details.sqlite3")
+
+    from utils.api import GamingNewsBot
+    api = GamingNewsBot(base_url=server.base_url)
+    failures: List[str] = []
+    callers = args.callers
+
+    def hits(path: str) -> int:
+        return server.requests[f"/api1/{path}"]
+
+    # /games: cold catalog
+    before = hits("games")
+    lists = await asyncio.gather(*(api.fetch_games_list() for _ in range(callers)))
+    check(
+        failures, hits("games") - before == 1 and all(len(games) == args.games for games in lists),
+        f"/games: {callers} callers -> {hits('games') - before} upstream request(s)"
+    )
+
+    # /game: cold detail cache, then revalidation of the same (expired) record
+    for label in ("cold", "revalidate"):
+        if label == "revalidate":
+            api.detail_cache.expire([7])
+        before = hits("game")
+        details = await asyncio.gather(*(api.fetch_game_details(7) for _ in range(callers)))
+        check(
+            failures, hits("game") - before == 1 and all(game is not None and game.id == 7 for game in details),
+            f"/game ({label}): {callers} callers -> {hits('game') - before} upstream request(s)"
+        )
+
+    # One caller cancelled mid-flight: everyone else still gets the game
+    before = hits("game")
+    tasks = [asyncio.ensure_future(api.fetch_game_details(9)) for _ in range(callers)]
+    await asyncio.sleep(args.latency / 2000)
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    survivors = results[1:]
+    check(
+        failures,
+        isinstance(results[0], asyncio.CancelledError)
+        and all(getattr(game, "id", None) == 9 for game in survivors) and hits("game") - before == 1,
+        f"/game (one cancelled): {len(survivors)} callers got the game, {hits('game') - before} upstream request(s)"
+    )
+
+    # Every caller cancelled, then a new one arrives while the request is still running
+    before = hits("game")
+    tasks = [asyncio.ensure_future(api.fetch_game_details(11)) for _ in range(callers)]
+    await asyncio.sleep(args.latency / 2000)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    late = await api.fetch_game_details(11)
+    check(
+        failures, late is not None and late.id == 11 and hits("game") - before == 1,
+        f"/game (all cancelled, late caller): {hits('game') - before} upstream request(s)"
+    )
+    check(failures, not api._inflight, f"{len(api._inflight)} request(s) left in flight")
+
+    await api.close_session()
+    await server.stop()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--callers", type=int, default=20)
+    parser.add_argument("--games", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=50.0, help="fake upstream latency in ms")
+    failures = asyncio.run(run(parser.parse_args()))
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
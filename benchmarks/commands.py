@@ -0,0 +1,164 @@
+"""Offline per-command benchmark against the local fake MMOBomb.
+
+Loads the real bot and cogs (no Discord connection), warms caches the same
+way on_ready does, then invokes every slash command callback with a fake
+interaction and reports latency percentiles and upstream requests.
+
+    python -m benchmarks.commands --iterations 50 --latency 40
+"""
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Dict, List
+
+from benchmarks.fake_mmobomb import FakeMMOBomb, generate_catalog, load_fixture
+
+# Arguments used when invoking each command; commands missing here run with defaults
+COMMAND_ARGS: Dict[str, Dict] = {
+    "latestnews": {"limit": 5},
+    "searchgame": {"game_name": "dragon legends"},
+    "gameinfo": {"game_id": 7},
+    "topgames": {"category": "shooter", "limit": 5},
+    "setchannel": {},
+    "newsoff": {},
+    "channel_info": {},
+}
+# These talk to Discord itself (or need a gateway connection for bot.latency)
+SKIPPED_COMMANDS = {"create_channel", "delete_channel", "ping"}
+_interaction_ids = itertools.count(1)
+
+
+class FakeResponse:
+    def __init__(self):
+        self.sent: List[Dict] = []
+        self.done = False
+
+    def is_done(self) -> bool:
+        return self.done
+
+    async def defer(self, **kwargs):
+        self.done = True
+
+    async def send_message(self, *args, **kwargs):
+        self.sent.append(kwargs)
+        self.done = True
+
+
+class FakeFollowup:
+    def __init__(self):
+        self.sent: List[Dict] = []
+
+    async def send(self, *args, **kwargs):
+        self.sent.append(kwargs)
+
+
+def fake_guild(channels: int = 20, members: int = 200):
+    everyone = [SimpleNamespace(bot=i % 10 == 0) for i in range(members)]
+    text_channels = [
+        SimpleNamespace(
+            id=1000 + i, name=f"channel-{i}", mention=f"<#{1000 + i}>", position=i, topic=None,
+            members=everyone, created_at=datetime.now(timezone.utc),
+            permissions_for=lambda user: SimpleNamespace(
+                manage_messages=True, manage_channels=True, send_messages=True, read_messages=True
+            ),
+        )
+        for i in range(channels)
+    ]
+    guild = SimpleNamespace(
+        id=1, name="Benchmark Guild", text_channels=text_channels, voice_channels=[], channels=text_channels, members=everyone
+    )
+    for channel in text_channels:
+        channel.guild = guild
+    return guild
+
+
+async def original_response():
+    return None
+
+
+def fake_interaction(guild):
+    user = SimpleNamespace(id=1, guild_permissions=SimpleNamespace(manage_channels=True), mention="<@1>")
+    return SimpleNamespace(
+        id=next(_interaction_ids), user=user, guild=guild, guild_id=guild.id, channel=guild.text_channels[0],
+        response=FakeResponse(), followup=FakeFollowup(), original_response=original_response,
+    )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(args):
+    games = load_fixture(args.fixture) if args.fixture else generate_catalog(args.games)
+    server = FakeMMOBomb(games, latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate)
+    await server.start()
+
+    data_dir = tempfile.mkdtemp(prefix="bench-")
+    os.environ["MMO_API_BASE_URL"] = server.base_url
+    os.environ["DETAIL_CACHE_PATH"] = os.path.join(data_dir, "details.sqlite3")
+    os.environ["SUBSCRIPTIONS_PATH"] = os.path.join(data_dir, "subscriptions.sqlite3")
+    os.environ["SEEN_IDS_PATH"] = os.path.join(data_dir, "seen.bin")
+
+    import bot as bot_module
+    bot = bot_module.bot
+    for ext in bot_module.initial_extensions:
+        await bot.load_extension(ext)
+
+    if not args.cold:
+        elapsed = await bot.scheduler.warm_up()
+        print(f"Warm-up: {elapsed * 1000:.1f} ms, {server.total_requests} upstream requests")
+
+    guild = fake_guild()
+    print(f"{'command':<16}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'upstream':>10}{'errors':>8}")
+
+    for command in bot.tree.walk_commands():
+        if command.name in SKIPPED_COMMANDS:
+            continue
+        kwargs = COMMAND_ARGS.get(command.name, {})
+        if command.name == "channel_info":
+            kwargs = {"channel": guild.text_channels[0]}
+
+        latencies: List[float] = []
+        errors = 0
+        before = server.total_requests
+        for _ in range(args.iterations):
+            interaction = fake_interaction(guild)
+            call_args = (command.binding, interaction) if command.binding else (interaction,)
+            started = time.perf_counter()
+            try:
+                await command.callback(*call_args, **kwargs)
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+        upstream = server.total_requests - before
+
+        print(
+            f"/{command.name:<15}{statistics.median(latencies):>9.2f}{percentile(latencies, 95):>9.2f}"
+            f"{percentile(latencies, 99):>9.2f}{max(latencies):>9.2f}{upstream:>10}{errors:>8}"
+        )
+
+    await bot.api.close_session()
+    await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--fixture", help="JSON file with a recorded /games response")
+    parser.add_argument("--games", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=40.0, help="fake upstream latency in ms")
+    parser.add_argument("--jitter", type=float, default=10.0, help="extra random upstream latency in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--cold", action="store_true", help="skip the on_ready style cache warm-up")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
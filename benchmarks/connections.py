@@ -0,0 +1,57 @@
+"""Back-to-back /gameinfo fetches: one pooled session vs a new session per call.
+
+The old cogs closed their aiohttp session after every command, so each
+/gameinfo paid for a new connection. This compares that with the shared
+keep-alive pool. Use --url to point at the real API (TLS makes the gap larger).
+
+    python -m benchmarks.connections --calls 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+from benchmarks.fake_mmobomb import FakeMMOBomb, generate_catalog
+from utils.api import GamingNewsBot
+
+
+async def timed_calls(api: GamingNewsBot, calls: int, reuse: bool) -> List[float]:
+    latencies = []
+    for i in range(calls):
+        started = time.perf_counter()
+        # Straight to the HTTP layer so the detail cache doesn't hide the connection cost
+        await api._get(f"{api.base_url}/game", {"id": i % 50 + 1})
+        latencies.append((time.perf_counter() - started) * 1000)
+        if not reuse:
+            await api.close_session()
+    await api.close_session()
+    return latencies
+
+
+async def run(args):
+    server = None
+    base_url = args.url
+    if not base_url:
+        server = FakeMMOBomb(generate_catalog(400), latency=args.latency / 1000)
+        await server.start()
+        base_url = server.base_url
+
+    for label, reuse in (("new session per call", False), ("shared pooled session", True)):
+        latencies = await timed_calls(GamingNewsBot(base_url=base_url), args.calls, reuse)
+        print(f"{label:<24} mean {statistics.mean(latencies):7.2f} ms   p50 {statistics.median(latencies):7.2f} ms   max {max(latencies):7.2f} ms")
+
+    if server:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="fake upstream latency in ms")
+    parser.add_argument("--url", help="API base URL to test instead of the local fake")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
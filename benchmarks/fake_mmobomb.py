@@ -0,0 +1,250 @@
+"""Local stand-in for the MMOBomb API (/games and /game).
+
+Serves a recorded catalog fixture (a JSON list as returned by /games) or a
+generated one, with injectable latency, error rate and catalog mutations.
+Point the bot at it with MMO_API_BASE_URL=http://127.0.0.1:<port>/api1.
+
+    python -m benchmarks.fake_mmobomb --port 8089 --latency 40 --games 400
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+from utils.catalog_index import category_of, platforms_of
+
+GENRES = [
+    "MMORPG", "Shooter", "MOBA", "Battle Royale", "Strategy", "Fighting",
+    "Action RPG", "Card Game", "Racing", "Sports", "MMOARPG", "Social",
+]
+PLATFORMS = ["PC (Windows)", "Web Browser", "PC (Windows), Web Browser"]
+STUDIOS = [
+    "Gravity", "Nexon", "Gameforge", "Riot Games", "Valve", "NetEase",
+    "Perfect World", "Pearl Abyss", "Smilegate", "Wargaming", "Tencent", "Kakao",
+]
+WORDS = [
+    "Legends", "Online", "Arena", "World", "Chronicles", "Tactics", "Shadow",
+    "Dragon", "Star", "Siege", "Realm", "Rift", "Heroes", "Kingdom", "Storm",
+    "Frontier", "Raid", "Guild", "Exile", "Blade", "Fortress", "Nova", "Eternal",
+]
+SYLLABLES = ["ar", "bel", "cor", "dra", "el", "fen", "gor", "hal", "ith", "kar", "lor", "mor", "nex", "or", "quel", "ryn", "sar", "tor", "ul", "vex", "wyn", "zar"]
+
+
+def _vocabulary(rng: random.Random, size: int = 1500) -> List[str]:
+    """Common title words plus made-up names, so titles are about as varied as the real catalog"""
+    names = {"".join(rng.choices(SYLLABLES, k=rng.randint(2, 3))).capitalize() for _ in range(size)}
+    return WORDS + sorted(names)
+
+
+def generate_catalog(count: int, seed: int = 1) -> List[Dict]:
+    """Deterministic catalog shaped like MMOBomb's /games response"""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary(rng)
+    games = []
+    for game_id in range(1, count + 1):
+        words = rng.sample(WORDS, 1) + rng.sample(vocabulary, rng.randint(0, 2))
+        rng.shuffle(words)
+        title = " ".join(words)
+        if rng.random() < 0.3:
+            title += f" {rng.randint(2, 4)}"
+        slug = title.lower().replace(" ", "-")
+        games.append({
+            "id": game_id,
+            "title": title,
+            "thumbnail": f"https://www.mmobomb.com/g/{game_id}/thumbnail.jpg",
+            "short_description": " ".join(rng.choices(WORDS, k=rng.randint(12, 30))).capitalize() + ".",
+            "game_url": f"https://www.mmobomb.com/open/{slug}",
+            "genre": rng.choice(GENRES),
+            "platform": rng.choice(PLATFORMS),
+            "publisher": rng.choice(STUDIOS),
+            "developer": rng.choice(STUDIOS),
+            "release_date": f"20{rng.randint(5, 25):02d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "profile_url": f"https://www.mmobomb.com/{slug}",
+        })
+    return games
+
+
+def detail_for(game: Dict) -> Dict:
+    """Expand a catalog record into a /game detail record"""
+    detail = dict(game)
+    detail["status"] = "Live"
+    detail["description"] = (game.get("short_description", "") + " ") * 8
+    detail["screenshots"] = [
+        {"id": game["id"] * 10 + i, "image": f"https://www.mmobomb.com/g/{game['id']}/{i}.jpg"}
+        for i in range(3)
+    ]
+    return detail
+
+
+class FakeMMOBomb:
+    """aiohttp app serving the fake API; usable in-process or from the command line"""
+
+    def __init__(self, games: List[Dict], latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, seed: int = 1):
+        self.games = games
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests: Counter = Counter()
+        self.bytes_sent = 0
+        self._rng = random.Random(seed)
+        self._version = 0
+        self._next_id = max((g["id"] for g in games), default=0) + 1
+        self._runner: Optional[web.AppRunner] = None
+        self.port: Optional[int] = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/api1/games", self.handle_games)
+        self.app.router.add_get("/api1/game", self.handle_game)
+        self.app.router.add_post("/_admin/mutate", self.handle_mutate)
+        self.app.router.add_post("/_admin/config", self.handle_config)
+        self.app.router.add_get("/_admin/stats", self.handle_stats)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/api1"
+
+    @property
+    def total_requests(self) -> int:
+        return sum(count for path, count in self.requests.items() if path.startswith("/api1"))
+
+    async def start(self, port: int = 0):
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    # Catalog mutations
+
+    def mutate(self, add: int = 0, change: int = 0, remove: int = 0):
+        """Add, edit and remove games, as the real catalog does over time"""
+        for game in self._rng.sample(self.games, min(change, len(self.games))):
+            game["short_description"] += " Updated."
+        for game in self._rng.sample(self.games, min(remove, len(self.games))):
+            self.games.remove(game)
+        if add:
+            new_games = generate_catalog(add, seed=self._rng.randint(0, 1 << 30))
+            for game in new_games:
+                game["id"] = self._next_id
+                game["release_date"] = time.strftime("%Y-%m-%d")
+                self._next_id += 1
+            self.games[:0] = new_games
+        self._version += 1
+
+    # Handlers
+
+    async def _simulate(self, request: web.Request) -> Optional[web.Response]:
+        self.requests[request.path] += 1
+        delay = self.latency + self._rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            return web.Response(status=500, text="injected error")
+        return None
+
+    def _json(self, data, headers: Dict = None) -> web.Response:
+        body = json.dumps(data).encode()
+        self.bytes_sent += len(body)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def handle_games(self, request: web.Request) -> web.Response:
+        failure = await self._simulate(request)
+        if failure:
+            return failure
+
+        # The listing only changes on mutate(), so the catalog version plus the query identifies it
+        etag = f'"games-{self._version}-{hash(request.query_string) & 0xFFFFFFFF:x}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+
+        games = self.games
+        category = request.query.get("category")
+        platform = request.query.get("platform")
+        if category:
+            games = [g for g in games if category_of(g["genre"]) == category]
+        if platform and platform != "all":
+            games = [g for g in games if platform in platforms_of(g["platform"])]
+        if request.query.get("sort-by") == "release-date":
+            games = sorted(games, key=lambda g: g["release_date"], reverse=True)
+        elif request.query.get("sort-by") == "alphabetical":
+            games = sorted(games, key=lambda g: g["title"])
+        if not games:
+            return self._json({"status": 0, "status_message": "No active giveaways available at the moment, please try again later."})
+        return self._json(games, headers={"ETag": etag})
+
+    async def handle_game(self, request: web.Request) -> web.Response:
+        failure = await self._simulate(request)
+        if failure:
+            return failure
+
+        try:
+            game_id = int(request.query.get("id", ""))
+        except ValueError:
+            return self._json({"status": 0, "status_message": "Invalid id"})
+        game = next((g for g in self.games if g["id"] == game_id), None)
+        if game is None:
+            return self._json({"status": 0, "status_message": "No game found with that ID"})
+
+        etag = f'"{game_id}-{hash(game["short_description"]) & 0xFFFFFFFF:x}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return self._json(detail_for(game), headers={"ETag": etag})
+
+    async def handle_mutate(self, request: web.Request) -> web.Response:
+        body = await request.json() if request.can_read_body else {}
+        self.mutate(add=body.get("add", 0), change=body.get("change", 0), remove=body.get("remove", 0))
+        return web.json_response({"games": len(self.games), "version": self._version})
+
+    async def handle_config(self, request: web.Request) -> web.Response:
+        body = await request.json() if request.can_read_body else {}
+        self.latency = body.get("latency", self.latency * 1000) / 1000
+        self.jitter = body.get("jitter", self.jitter * 1000) / 1000
+        self.error_rate = body.get("error_rate", self.error_rate)
+        return web.json_response({"latency_ms": self.latency * 1000, "jitter_ms": self.jitter * 1000, "error_rate": self.error_rate})
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"requests": dict(self.requests), "bytes_sent": self.bytes_sent, "games": len(self.games)})
+
+
+def load_fixture(path: str) -> List[Dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+async def _serve(args):
+    games = load_fixture(args.fixture) if args.fixture else generate_catalog(args.games)
+    server = FakeMMOBomb(games, latency=args.latency / 1000, jitter=args.jitter / 1000, error_rate=args.error_rate)
+    await server.start(args.port)
+    print(f"Fake MMOBomb serving {len(games)} games at {server.base_url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--fixture", help="JSON file with a recorded /games response")
+    parser.add_argument("--games", type=int, default=400, help="size of the generated catalog when no fixture is given")
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency per request in ms")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency per request in ms")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with HTTP 500")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Peak and retained memory of the full catalog as raw dicts vs Game records.
+
+"dict" decodes the whole /games body with json.loads. "game" is the path the
+bot uses: the body is streamed through GamingNewsBot._read_games, which
+builds Game records without ever holding the list of dicts. Each mode runs
+in its own process, reading the same payload from a file, and peak RSS is
+reported above that process's baseline taken just before decoding.
+
+    python -m benchmarks.memory --games 5000
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from typing import List
+
+from benchmarks.fake_mmobomb import generate_catalog
+from utils.api import STREAM_CHUNK_SIZE, GamingNewsBot
+
+
+class _Body:
+    """Just enough of aiohttp's StreamReader for _read_games"""
+
+    def __init__(self, payload: bytes):
+        self._payload = memoryview(payload)
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._payload), size):
+            yield bytes(self._payload[start:start + size])
+
+
+class _Response:
+    def __init__(self, payload: bytes):
+        self.content = _Body(payload)
+
+
+def _rss_kb(field: str) -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    raise KeyError(field)
+
+
+def start_peak() -> int:
+    """Reset the peak RSS (Linux) and return the current RSS in KB as the baseline"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return _rss_kb("VmRSS")
+    except OSError:
+        # No resettable high-water mark: measure against the peak so far
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def peak_rss_kb() -> int:
+    try:
+        return _rss_kb("VmHWM")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def decode(mode: str, payload: bytes) -> List:
+    if mode == "dict":
+        return json.loads(payload)
+    games, _ = asyncio.run(GamingNewsBot._read_games(_Response(payload)))
+    return games
+
+
+def measure(mode: str, path: str):
+    with open(path, "rb") as f:
+        payload = f.read()
+    gc.collect()
+    baseline_kb = start_peak()
+
+    # Peak RSS without tracemalloc, whose own bookkeeping grows with the number of objects
+    catalog = decode(mode, payload)
+    gc.collect()
+    peak_kb = peak_rss_kb() - baseline_kb
+    del catalog
+    gc.collect()
+
+    tracemalloc.start()
+    catalog = decode(mode, payload)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(json.dumps({
+        "mode": mode, "records": len(catalog), "retained_kb": retained // 1024,
+        "peak_kb": peak // 1024, "peak_rss_kb": peak_kb,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--mode", choices=["dict", "game"], help="measure one mode in this process")
+    parser.add_argument("--payload", help="file with the /games body (used with --mode)")
+    args = parser.parse_args()
+
+    if args.mode:
+        measure(args.mode, args.payload)
+        return
+
+    fd, path = tempfile.mkstemp(prefix="bench-", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(generate_catalog(args.games)).encode())
+        print(f"payload {os.path.getsize(path) // 1024} KB, {args.games} games (peak RSS is above each process's baseline)")
+        for mode in ("dict", "game"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.memory", "--mode", mode, "--payload", path],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:<5} {result['records']} records: retained {result['retained_kb']:>7} KB, "
+                f"traced peak {result['peak_kb']:>7} KB, peak RSS +{result['peak_rss_kb']:>6} KB"
+            )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
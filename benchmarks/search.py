@@ -0,0 +1,46 @@
+"""Per-query cost of the title search index vs the old linear substring scan.
+
+    python -m benchmarks.search --games 12000
+"""
+import argparse
+import time
+
+from benchmarks.fake_mmobomb import generate_catalog
+from utils.api import Game
+from utils.search import SearchIndex
+
+QUERIES = ["dragon", "shadow realm", "legnds", "star rift 2", "guild", "x", "eternal blade"]
+
+
+def linear_search(games, term, limit=5):
+    return [game for game in games if term.lower() in (game.title or "").lower()][:limit]
+
+
+def per_query_ms(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=12000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    games = [Game.from_dict(g) for g in generate_catalog(args.games)]
+    started = time.perf_counter()
+    index = SearchIndex(games)
+    print(f"Index build for {len(games)} titles: {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    print(f"{'query':<16}{'linear ms':>11}{'index ms':>10}{'complete ms':>13}")
+    for query in QUERIES:
+        linear = per_query_ms(lambda: linear_search(games, query), args.repeat)
+        ranked = per_query_ms(lambda: index.search(query, 5), args.repeat)
+        complete = per_query_ms(lambda: index.complete(query, 25), args.repeat)
+        print(f"{query:<16}{linear:>11.3f}{ranked:>10.3f}{complete:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
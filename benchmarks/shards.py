@@ -0,0 +1,177 @@
+"""Sharded auto news and member counts against fake shards and the local fake MMOBomb.
+
+Loads the real bot in sharded mode (no Discord connection), spreads fake
+guilds over the shards, marks all but one shard connected and runs one auto
+news poll. Checks that upstream is polled once for the whole process, that
+every shard only posts to and counts its own guilds, and that the
+disconnected shard posts the held news once it connects.
+
+    python -m benchmarks.shards --shards 4 --guilds 200
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import discord
+
+from benchmarks.fake_mmobomb import FakeMMOBomb, generate_catalog
+from utils.sharding import shard_for_guild
+
+
+class FakeChannel(SimpleNamespace):
+    async def send(self, *args, **kwargs):
+        self.sent.append(kwargs)
+
+
+def fake_guilds(count: int, shard_count: int, channels: int = 3, members: int = 20) -> List[SimpleNamespace]:
+    everyone = [SimpleNamespace(bot=i % 10 == 0) for i in range(members)]
+    guilds = []
+    for i in range(count):
+        # Snowflakes keep the creation time above bit 22, which is what the shard formula reads
+        guild_id = ((i * 7919) << 22) | i
+        guild = SimpleNamespace(
+            id=guild_id, shard_id=shard_for_guild(guild_id, shard_count), members=everyone, unavailable=False
+        )
+        guild.text_channels = [
+            FakeChannel(
+                id=guild_id * 10 + c, guild=guild, name=f"channel-{c}", sent=[],
+                created_at=datetime.now(timezone.utc),
+                permissions_for=lambda member: SimpleNamespace(read_messages=True),
+            )
+            for c in range(channels)
+        ]
+        guild.get_channel = {channel.id: channel for channel in guild.text_channels}.get
+        guilds.append(guild)
+    return guilds
+
+
+def delivered_by_shard(guilds: List[SimpleNamespace]) -> Dict[int, int]:
+    counts: Dict[int, int] = {}
+    for guild in guilds:
+        for channel in guild.text_channels:
+            counts[guild.shard_id] = counts.get(guild.shard_id, 0) + len(channel.sent)
+    return counts
+
+
+def check(failures: List[str], ok: bool, message: str):
+    print(f"{'ok  ' if ok else 'FAIL'} {message}")
+    if not ok:
+        failures.append(message)
+
+
+async def run(args) -> List[str]:
+    games = generate_catalog(args.games)
+    server = FakeMMOBomb(games)
+    await server.start()
+
+    data_dir = tempfile.mkdtemp(prefix="bench-")
+    os.environ["SHARD_COUNT"] = str(args.shards)
+    os.environ["MMO_API_BASE_URL"] = server.base_url
+    os.environ["DETAIL_CACHE_PATH"] = os.path.join(data_dir, "details.sqlite3")
+    os.environ["SUBSCRIPTIONS_PATH"] = os.path.join(data_dir, "subscriptions.sqlite3")
+    os.environ["SEEN_IDS_PATH"] = os.path.join(data_dir, "seen.bin")
+    os.environ["METRICS_PORT"] = "0"
+
+    import bot as bot_module
+    bot = bot_module.bot
+    failures: List[str] = []
+    check(failures, bot.local_shards() == list(range(args.shards)), f"bot runs shards {bot.local_shards()}")
+
+    guilds = fake_guilds(args.guilds, args.shards)
+    bot.get_guild = {guild.id: guild for guild in guilds}.get
+    bot.is_ready = lambda: True
+    for guild in guilds:
+        for channel in guild.text_channels[:2]:
+            bot.subscriptions.add(guild.id, channel.id)
+
+    await bot.scheduler.warm_up()
+    down = args.shards - 1
+    for shard_id in range(args.shards):
+        if shard_id != down:
+            await bot_module.on_shard_ready(shard_id)
+
+    # One auto news run: poll once, fan out per shard
+    polls = 0
+    get_new_games = bot.api.get_new_games
+
+    async def counted_get_new_games(*a, **kw):
+        nonlocal polls
+        polls += 1
+        return await get_new_games(*a, **kw)
+
+    bot.api.get_new_games = counted_get_new_games
+    server.mutate(add=2)
+    before = server.total_requests
+    await bot_module.auto_news_task.coro()
+    upstream = server.total_requests - before
+
+    expected = {shard_id: len(channel_ids) for shard_id, channel_ids in bot.subscriptions.by_shard(args.shards).items()}
+    delivered = delivered_by_shard(guilds)
+    check(failures, polls == 1, f"upstream polled {polls}x for {args.shards} shards ({upstream} request(s))")
+    for shard_id in range(args.shards):
+        report = bot.last_fanout_reports.get(shard_id)
+        if shard_id == down:
+            held = len(bot.shard_tracker.pending.get(shard_id, ()))
+            check(failures, delivered.get(shard_id, 0) == 0 and held == 1, f"shard {shard_id} (down) held {held} post(s), sent nothing")
+        else:
+            ok = report is not None and report.delivered == expected.get(shard_id, 0) == delivered.get(shard_id, 0)
+            check(failures, ok, f"shard {shard_id} delivered {delivered.get(shard_id, 0)}/{expected.get(shard_id, 0)} to its own guilds")
+
+    await bot_module.on_shard_ready(down)
+    delivered = delivered_by_shard(guilds)
+    check(
+        failures, delivered.get(down, 0) == expected.get(down, 0) and not bot.shard_tracker.pending,
+        f"shard {down} posted held news on connect ({delivered.get(down, 0)}/{expected.get(down, 0)})"
+    )
+
+    # A poll while the cache is rebuilt (or a guild is unavailable) skips channels, never prunes them
+    subscribed = len(bot.subscriptions)
+    guilds[0].unavailable = True
+    bot.is_ready = lambda: False
+    not_ready = await bot.fan_out_news(discord.Embed(title="test"))
+    bot.is_ready = lambda: True
+    unavailable = await bot.fan_out_news(discord.Embed(title="test"))
+    guilds[0].unavailable = False
+    skipped = not_ready.failed + unavailable.failed
+    check(
+        failures, len(bot.subscriptions) == subscribed and skipped == subscribed + 2,
+        f"cache misses while not ready skipped {skipped} send(s), kept {len(bot.subscriptions)}/{subscribed} subscriptions"
+    )
+
+    # Member counts: each partition only holds its shard's guilds
+    for guild in guilds:
+        bot.member_counts.counts(guild.text_channels[0])
+    owners: Dict[int, Tuple[int, ...]] = {
+        shard_id: tuple(counts._guilds) for shard_id, counts in bot.member_counts.shards.items()
+    }
+    by_id = {guild.id: guild for guild in guilds}
+    misplaced = sum(1 for shard_id, guild_ids in owners.items() for guild_id in guild_ids if by_id[guild_id].shard_id != shard_id)
+    check(failures, misplaced == 0 and sum(map(len, owners.values())) == len(guilds), f"member counts split over {len(owners)} shards, {misplaced} misplaced")
+
+    await bot_module.on_shard_ready(0)
+    kept = sum(len(bot.member_counts.shard(shard_id)._guilds) for shard_id in owners if shard_id != 0)
+    check(
+        failures, not bot.member_counts.shard(0)._guilds and kept == len(guilds) - len(owners.get(0, ())),
+        "re-identifying shard 0 only reset its own member counts"
+    )
+
+    await bot.api.close_session()
+    await server.stop()
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--shards", type=int, default=4)
+    parser.add_argument("--guilds", type=int, default=200)
+    parser.add_argument("--games", type=int, default=500)
+    failures = asyncio.run(run(parser.parse_args()))
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Full-body JSON parse vs streaming decode of /games, with and without a limit.
+
+"full parse" is the old path: read the whole body, json-decode it into a list
+of dicts, then build Game records (and slice for /latestnews). "stream" builds
+Game records while the body arrives; "stream limit=N" stops reading after N.
+The fake server runs in a separate process so only client memory is traced.
+
+    python -m benchmarks.streaming --games 5000 --limit 3
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+import aiohttp
+
+from utils.api import Game, GamingNewsBot
+
+
+async def full_parse(resp: aiohttp.ClientResponse, limit: int = None) -> List[Game]:
+    data = await resp.json()
+    games = [game for game in (Game.from_dict(item) for item in data) if game is not None]
+    return games[:limit] if limit else games
+
+
+async def stream(resp: aiohttp.ClientResponse, limit: int = None) -> List[Game]:
+    games, _ = await GamingNewsBot._read_games(resp, limit)
+    return games
+
+
+async def run_mode(session: aiohttp.ClientSession, url: str, decode: Callable, limit: int, iterations: int):
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        async with session.get(url) as resp:
+            games = await decode(resp, limit)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    async with session.get(url) as resp:
+        games = await decode(resp, limit)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(games), latencies, peak
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for(url: str, timeout: float = 15.0):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(url) as resp:
+                    if resp.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("fake MMOBomb did not start")
+            await asyncio.sleep(0.1)
+
+
+async def run(args):
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.fake_mmobomb", "--port", str(port), "--games", str(args.games)],
+        stdout=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}/api1/games?sort-by=release-date"
+    try:
+        await wait_for(url)
+        modes = [
+            ("full parse", full_parse, None),
+            (f"full parse [:{args.limit}]", full_parse, args.limit),
+            ("stream", stream, None),
+            (f"stream limit={args.limit}", stream, args.limit),
+        ]
+        print(f"{args.games} games, {args.iterations} iterations")
+        async with aiohttp.ClientSession() as session:
+            for label, decode, limit in modes:
+                records, latencies, peak = await run_mode(session, url, decode, limit, args.iterations)
+                print(
+                    f"{label:<20} {records:>6} records   p50 {statistics.median(latencies):8.2f} ms   "
+                    f"max {max(latencies):8.2f} ms   peak {peak / 1024:9.0f} KB"
+                )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=3)
+    parser.add_argument("--iterations", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
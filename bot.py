@@ -1,18 +1,302 @@
+import time
+# Taken before the imports below, which make up the "import" startup phase
+_IMPORTS_STARTED = time.perf_counter()
+
 import os
+import logging
 import discord
+from discord import app_commands
 from discord.ext import commands, tasks
 from dotenv import load_dotenv
 import asyncio
+from typing import Dict, List, Optional, Tuple
+from utils.api import GamingNewsBot
+from utils.resilience import UpstreamError
+from utils.subscriptions import SubscriptionStore
+from utils.fanout import FanoutReport, RateLimiter, fan_out
+from utils.embeds import EmbedRenderer
+from utils.scheduler import AdaptiveInterval, RefreshScheduler
+from utils.metrics import MetricsServer, metrics
+from utils.logs import setup_logging, shutdown_logging
+from utils.command_sync import SyncState, command_tree_hash
+from utils.startup import StartupTimer
+from utils.member_counts import ChannelMemberCounts
+from utils.pagination import PageSessions
+from utils.sharding import ShardedMemberCounts, ShardTracker
 
 load_dotenv()
+logger = logging.getLogger("bot")
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
+SUBSCRIPTIONS_PATH = os.getenv("SUBSCRIPTIONS_PATH", os.path.join("data", "subscriptions.sqlite3"))
+COMMAND_SYNC_STATE_PATH = os.getenv("COMMAND_SYNC_STATE_PATH", os.path.join("data", "command_sync.json"))
+NEWS_FANOUT_CONCURRENCY = int(os.getenv("NEWS_FANOUT_CONCURRENCY", "10"))
+NEWS_FANOUT_RATE = float(os.getenv("NEWS_FANOUT_RATE", "40"))
+CATALOG_REFRESH_SECONDS = float(os.getenv("CATALOG_REFRESH_SECONDS", "240"))
+LATEST_REFRESH_SECONDS = float(os.getenv("LATEST_REFRESH_SECONDS", "270"))
+# Auto news polling starts at NEWS_INTERVAL_HOURS and adapts between the floor and ceiling
+NEWS_INTERVAL_HOURS = float(os.getenv("NEWS_INTERVAL_HOURS", "2"))
+NEWS_POLL_FLOOR_MINUTES = float(os.getenv("NEWS_POLL_FLOOR_MINUTES", "15"))
+NEWS_POLL_CEILING_MINUTES = float(os.getenv("NEWS_POLL_CEILING_MINUTES", "240"))
+METRICS_HOST = os.getenv("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "9108"))
+# Auto news failures meaning the channel is gone for good; its subscription is dropped
+DEAD_CHANNEL_FAILURES = {"NotFound"}
+# Unset runs a single gateway connection; "auto" lets Discord pick the shard count.
+# SHARD_IDS limits this process to some of the shards (comma-separated).
+SHARD_COUNT = os.getenv("SHARD_COUNT", "")
+SHARD_IDS = os.getenv("SHARD_IDS", "")
+SHARDED = bool(SHARD_COUNT)
+
+def shard_options() -> Dict:
+    """AutoShardedBot arguments from SHARD_COUNT and SHARD_IDS"""
+    if not SHARDED or SHARD_COUNT == "auto":
+        return {}
+    options = {"shard_count": int(SHARD_COUNT)}
+    if SHARD_IDS:
+        options["shard_ids"] = [int(shard_id) for shard_id in SHARD_IDS.split(",")]
+    return options
+
+class ChannelUnavailable(Exception):
+    """An auto news channel can't be resolved right now (guild unavailable or cache not ready)"""
 
 intents = discord.Intents.default()
 intents.message_content = True
+# Privileged: member join/leave/update events keep the per-channel member counts current
+intents.members = True
+
+class InstrumentedTree(app_commands.CommandTree):
+    """Command tree that records latency and outcome of every interaction it handles"""
+
+    async def _call(self, interaction: discord.Interaction):
+        # _call covers slash commands, context menus and autocomplete; errors are routed to on_error
+        started = time.perf_counter()
+        try:
+            await super()._call(interaction)
+        finally:
+            name = interaction.command.qualified_name if interaction.command else (interaction.data or {}).get("name", "unknown")
+            kind = "autocomplete" if interaction.type is discord.InteractionType.autocomplete else "command"
+            elapsed = time.perf_counter() - started
+            metrics.observe("command_seconds", elapsed, command=name, kind=kind)
+            metrics.inc("commands_total", command=name, kind=kind)
+            logger.log(
+                logging.DEBUG if kind == "autocomplete" else logging.INFO,
+                "Handled /%s", name,
+                extra={"command": name, "guild": interaction.guild_id, "latency_ms": round(elapsed * 1000, 1)}
+            )
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
+        name = interaction.command.qualified_name if interaction.command else "unknown"
+        metrics.inc("command_errors_total", command=name)
+        logger.error("Error in /%s: %s", name, error, extra={"command": name, "guild": interaction.guild_id})
+        await super().on_error(interaction, error)
+
+class GamingBot(commands.AutoShardedBot if SHARDED else commands.Bot):
+    """Bot that owns the process-wide MMOBomb API client and news subscriptions.
+
+    When sharded, upstream polling and caches stay process-wide, while auto
+    news delivery and member counts are split by the shard that owns each guild.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.api = GamingNewsBot()
+        self.renderer = EmbedRenderer()
+        self.api.catalog_listeners.append(self.renderer.on_catalog_diff)
+        self.api.detail_listeners.append(self.renderer.on_detail_changed)
+        self.subscriptions = SubscriptionStore(SUBSCRIPTIONS_PATH)
+        self.sync_state = SyncState(COMMAND_SYNC_STATE_PATH)
+        self.member_counts = ShardedMemberCounts() if SHARDED else ChannelMemberCounts()
+        self.shard_tracker = ShardTracker()
+        self.page_sessions = PageSessions()
+        self.last_fanout_report = None
+        self.last_fanout_reports: Dict[int, FanoutReport] = {}
+        self.startup = StartupTimer(started=_IMPORTS_STARTED)
+        self._warm_task: Optional[asyncio.Task] = None
+        self.news_interval = AdaptiveInterval(
+            NEWS_POLL_FLOOR_MINUTES * 60, NEWS_POLL_CEILING_MINUTES * 60, initial=NEWS_INTERVAL_HOURS * 3600
+        )
+        
+        # Catalog refresh also rebuilds the search and category indexes
+        self.scheduler = RefreshScheduler()
+        self.scheduler.add("catalog", self.api.refresh_catalog, CATALOG_REFRESH_SECONDS)
+        self.scheduler.add("latest", self.api.refresh_latest_games, LATEST_REFRESH_SECONDS)
+        
+        metrics.add_collector(self.collect_gauges)
+        self.metrics_server = MetricsServer(metrics, METRICS_HOST, METRICS_PORT) if METRICS_PORT else None
+
+    def collect_gauges(self):
+        """Cache and subscription gauges, read when metrics are rendered"""
+        catalog = self.api.catalog_cache.stats()
+        detail = self.api.detail_cache.stats()
+        render = self.renderer.stats()
+        yield "cache_entries", {"cache": "catalog"}, catalog["entries"]
+        yield "cache_hit_ratio", {"cache": "catalog"}, catalog["hit_ratio"]
+        yield "cache_entries", {"cache": "detail"}, detail["entries"]
+        yield "cache_hit_ratio", {"cache": "detail"}, detail["hits"] / max(1, detail["hits"] + detail["misses"])
+        yield "cache_entries", {"cache": "render"}, render["entries"]
+        yield "cache_hit_ratio", {"cache": "render"}, render["hit_ratio"]
+        yield "upstream_circuit_open", {}, int(self.api.breaker.state == "open")
+        yield "news_subscriptions", {}, len(self.subscriptions)
+        yield "page_sessions", {}, len(self.page_sessions)
+        yield "news_poll_interval_seconds", {}, self.news_interval.current
+        if SHARDED:
+            yield "shards_ready", {}, len(self.shard_tracker.ready)
+            for shard_id, held in self.shard_tracker.pending.items():
+                yield "auto_news_held", {"shard": shard_id}, len(held)
+        for phase, seconds in self.startup.phases.items():
+            yield "startup_phase_seconds", {"phase": phase}, seconds
+        if self.startup.ready_after is not None:
+            yield "startup_ready_seconds", {}, self.startup.ready_after
+        yield "guilds", {}, len(self.guilds)
+
+    async def setup_hook(self):
+        """Load persisted state, start the metrics endpoint and begin warming caches before connecting"""
+        self.subscriptions.load()
+        self.sync_state.load()
+        logger.info("📋 Loaded %d news subscription(s)", len(self.subscriptions))
+        
+        # Only needs MMOBomb, so it overlaps with the gateway connect instead of following it
+        self._warm_task = asyncio.create_task(self._warm_up())
+        
+        if self.metrics_server:
+            try:
+                await self.metrics_server.start()
+                logger.info("📈 Metrics at http://%s:%s/metrics", METRICS_HOST, METRICS_PORT)
+            except OSError as e:
+                logger.error("❌ Metrics endpoint failed to start: %s", e)
+                self.metrics_server = None
+
+    async def _warm_up(self):
+        elapsed = await self.scheduler.warm_up()
+        self.startup.record("cache warm", elapsed)
+        logger.info("🔥 Warmed catalog, indexes and latest games in %.2fs", elapsed)
+
+    async def warm_caches(self):
+        """Wait for the cache warm-up, starting it if setup_hook didn't"""
+        if self._warm_task is None:
+            self._warm_task = asyncio.create_task(self._warm_up())
+        await self._warm_task
+
+    async def sync_tree(self, force: bool = False) -> Optional[List[app_commands.AppCommand]]:
+        """Sync global slash commands, skipped when they are unchanged since the last sync.
 
-bot = commands.Bot(command_prefix="!", intents=intents)
+        Returns the synced commands, or None if the sync was skipped.
+        """
+        digest = command_tree_hash(self.tree)
+        if not force and self.sync_state.matches(self.application_id, digest):
+            saved = self.sync_state.sync_seconds
+            metrics.inc("tree_syncs_skipped_total")
+            metrics.inc("tree_sync_seconds_saved_total", saved)
+            logger.info("⏭️ Slash commands unchanged, skipped sync (saved ~%.2fs)", saved, extra={"tree_hash": digest[:12]})
+            return None
+        
+        started = time.perf_counter()
+        synced = await self.tree.sync()
+        elapsed = time.perf_counter() - started
+        metrics.observe("tree_sync_seconds", elapsed)
+        try:
+            self.sync_state.save(self.application_id, digest, elapsed)
+        except OSError as e:
+            logger.warning("Could not save command sync state: %s", e)
+        return synced
+
+    def local_shards(self) -> List[int]:
+        """Shards run by this process (just 0 when not sharded)"""
+        if not SHARDED:
+            return [0]
+        if self.shard_ids is not None:
+            return list(self.shard_ids)
+        return list(range(self.shard_count or 0))
+
+    def shard_ready(self, shard_id: int) -> bool:
+        return not SHARDED or shard_id in self.shard_tracker.ready
+
+    async def fan_out_news(self, embed: discord.Embed) -> FanoutReport:
+        """Post an auto news embed to every subscribed channel, one fan-out per shard.
+
+        Each shard only delivers to channels in its own guilds. A disconnected
+        shard holds the embed and posts it once it is connected again.
+        """
+        groups = self.subscriptions.by_shard(self.shard_count or 1)
+        # Discord's global rate limit is per bot, not per shard
+        limiter = RateLimiter(NEWS_FANOUT_RATE)
+        runs = {}
+        for shard_id in self.local_shards():
+            targets = groups.get(shard_id)
+            if not targets:
+                continue
+            if self.shard_ready(shard_id):
+                runs[shard_id] = self._fan_out_shard(shard_id, targets, embed, limiter)
+            else:
+                self.shard_tracker.hold(shard_id, embed)
+                logger.warning(
+                    "📰 Shard %d is disconnected, holding news for %d channel(s)", shard_id, len(targets),
+                    extra={"shard": shard_id}
+                )
+        
+        reports = dict(zip(runs, await asyncio.gather(*runs.values())))
+        self.last_fanout_reports.update(reports)
+        return FanoutReport.combine(reports.values())
+
+    async def _fan_out_shard(
+        self, shard_id: int, targets: List[Tuple[int, int]], embed: discord.Embed, limiter: Optional[RateLimiter] = None
+    ) -> FanoutReport:
+        async def send_news(target: Tuple[int, int]):
+            guild_id, channel_id = target
+            guild = self.get_guild(guild_id)
+            if not self.is_ready() or guild is None or guild.unavailable:
+                # The cache is still being rebuilt (re-identify) or Discord can't serve the guild:
+                # skip it this run, a missing channel here doesn't mean it was deleted
+                raise ChannelUnavailable(f"channel {channel_id} not cached")
+            # A channel missing from an available guild may have been deleted while the bot
+            # was offline; sending through a partial channel lets Discord answer NotFound
+            channel = guild.get_channel(channel_id) or self.get_partial_messageable(channel_id, guild_id=guild_id)
+            await channel.send(embed=embed)
+        
+        # The embed is built once and delivered to every channel of the shard concurrently
+        report = await fan_out(
+            targets,
+            send_news,
+            concurrency=NEWS_FANOUT_CONCURRENCY,
+            rate=NEWS_FANOUT_RATE,
+            limiter=limiter,
+        )
+        metrics.inc("auto_news_deliveries_total", report.delivered, result="delivered", shard=shard_id)
+        metrics.inc("auto_news_deliveries_total", report.failed, result="failed", shard=shard_id)
+        if SHARDED:
+            logger.info("📰 Shard %d: %s", shard_id, report.summary(), extra={"shard": shard_id})
+        
+        # Deleted channels (including ones deleted while the bot was offline) would fail every run
+        dead = [target for target, reason in report.failures.items() if reason in DEAD_CHANNEL_FAILURES]
+        for guild_id, channel_id in dead:
+            self.subscriptions.remove(guild_id, channel_id)
+        if dead:
+            metrics.inc("news_subscriptions_pruned_total", len(dead))
+            logger.info("🧹 Removed %d subscription(s) to deleted channels", len(dead), extra={"shard": shard_id})
+        return report
+
+    async def shard_connected(self, shard_id: int):
+        """Mark a shard ready and post the auto news it held while disconnected"""
+        held = self.shard_tracker.mark_ready(shard_id)
+        if not held:
+            return
+        for embed in held:
+            targets = self.subscriptions.by_shard(self.shard_count or 1).get(shard_id)
+            if not targets:
+                break
+            self.last_fanout_reports[shard_id] = await self._fan_out_shard(shard_id, targets, embed)
+        logger.info("📰 Shard %d posted %d held news update(s)", shard_id, len(held), extra={"shard": shard_id})
 
-bot.news_channel_id = None
+    async def close(self):
+        """Stop refreshes, flush subscriptions and close the shared HTTP session before disconnecting"""
+        self.scheduler.stop()
+        if self.metrics_server:
+            await self.metrics_server.stop()
+        self.subscriptions.close()
+        await self.api.close_session()
+        await super().close()
+
+bot = GamingBot(command_prefix="!", intents=intents, tree_cls=InstrumentedTree, **shard_options())
 
 initial_extensions = [
     "cogs.news",
@@ -23,33 +307,69 @@ initial_extensions = [
 
 @bot.event
 async def on_ready():
-    print(f"🤖 {bot.user} is online in {len(bot.guilds)} guilds!")
+    logger.info("🤖 %s is online in %d guilds!", bot.user, len(bot.guilds))
+    bot.startup.end("gateway connect")
+    
+    # Both only wait on the network (MMOBomb and Discord), so run them together
+    await asyncio.gather(bot.warm_caches(), sync_on_ready())
+    if not bot.scheduler.running:
+        bot.scheduler.start()
     
     if not auto_news_task.is_running():
         auto_news_task.start()
-        print("📰 Auto news task started!")
+        logger.info("📰 Auto news task started!")
+    
+    if not flush_subscriptions_task.is_running():
+        flush_subscriptions_task.start()
+    
+    if bot.startup.ready_after is None:
+        bot.startup.ready()
+        logger.info(
+            "🚀 Startup: %s", bot.startup.summary(),
+            extra={f"{phase.replace(' ', '_')}_s": round(seconds, 3) for phase, seconds in bot.startup.phases.items()}
+        )
 
+@bot.event
+async def on_shard_ready(shard_id: int):
+    # A fresh IDENTIFY rebuilt this shard's guild cache, so its member counts start over
+    bot.member_counts.reset_shard(shard_id)
+    logger.info("🧩 Shard %d ready", shard_id, extra={"shard": shard_id})
+    await bot.shard_connected(shard_id)
+
+@bot.event
+async def on_shard_resumed(shard_id: int):
+    await bot.shard_connected(shard_id)
+
+@bot.event
+async def on_shard_disconnect(shard_id: int):
+    bot.shard_tracker.mark_down(shard_id)
+    logger.warning("🧩 Shard %d disconnected", shard_id, extra={"shard": shard_id})
+
+async def sync_on_ready():
     try:
-        synced = await bot.tree.sync()
-        print(f"✅ Synced {len(synced)} slash command(s)")
-        
-        for cmd in synced:
-            print(f"  • /{cmd.name} - {cmd.description}")
+        # Runs on every (re)connect, but only talks to Discord when the commands changed
+        with bot.startup.phase("tree sync"):
+            synced = await bot.sync_tree()
+        if synced is not None:
+            logger.info("✅ Synced %d slash command(s)", len(synced))
+            
+            for cmd in synced:
+                logger.info("  • /%s - %s", cmd.name, cmd.description)
             
     except Exception as e:
-        print(f"❌ Failed to sync commands: {e}")
+        logger.error("❌ Failed to sync commands: %s", e)
 
 @bot.command(name="sync")
 @commands.is_owner()
 async def sync_commands(ctx):
-    """Manually sync slash commands (owner only)"""
+    """Manually sync slash commands, even if they look unchanged (owner only)"""
     try:
-        synced = await bot.tree.sync()
+        synced = await bot.sync_tree(force=True)
         await ctx.send(f"✅ Synced {len(synced)} commands!")
-        print(f"Manual sync: {len(synced)} commands")
+        logger.info("Manual sync: %d commands", len(synced))
     except Exception as e:
         await ctx.send(f" Sync failed: {e}")
-        print(f"Manual sync failed: {e}")
+        logger.error("Manual sync failed: %s", e)
 
 @bot.tree.command(name="test", description="Test if slash commands are working")
 async def test_command(interaction: discord.Interaction):
@@ -71,25 +391,153 @@ async def debug_cogs(ctx):
     embed = discord.Embed(title="🔧 Debug Info", color=discord.Color.blue())
     embed.add_field(name="Loaded Cogs", value="\n".join(loaded_cogs) if loaded_cogs else "None", inline=False)
     embed.add_field(name="Slash Commands", value="\n".join(all_commands) if all_commands else "None", inline=False)
-    embed.add_field(name="News Channel", value=bot.news_channel_id or "Not Set", inline=False)
+    embed.add_field(
+        name="News Subscriptions",
+        value=f"{len(bot.subscriptions)} channel(s) in {len(bot.subscriptions.guilds())} guild(s)",
+        inline=False
+    )
+    
+    cache_stats = bot.api.catalog_cache.stats()
+    embed.add_field(
+        name="Catalog Cache",
+        value=(
+            f"{cache_stats['entries']} entries • {cache_stats['hits']} hits • "
+            f"{cache_stats['stale_hits']} stale • {cache_stats['misses']} misses "
+            f"({cache_stats['hit_ratio']:.0%})"
+        ),
+        inline=False
+    )
+    
+    if bot.last_fanout_report:
+        embed.add_field(name="Last Auto News Run", value=bot.last_fanout_report.summary()[:1024], inline=False)
+    
+    if SHARDED:
+        subscribed = bot.subscriptions.by_shard(bot.shard_count or 1)
+        shard_lines = []
+        for shard_id in bot.local_shards():
+            line = (
+                f"#{shard_id}: {'ready' if bot.shard_ready(shard_id) else 'down'} • "
+                f"{len(subscribed.get(shard_id, ()))} channel(s) • {len(bot.shard_tracker.pending.get(shard_id, ()))} held"
+            )
+            report = bot.last_fanout_reports.get(shard_id)
+            if report:
+                line += f" • last {report.delivered} delivered, {report.failed} failed"
+            shard_lines.append(line)
+        embed.add_field(name="Shards", value="\n".join(shard_lines)[:1024] or "None", inline=False)
+    
+    render_stats = bot.renderer.stats()
+    embed.add_field(
+        name="Embed Render Cache",
+        value=f"{render_stats['entries']} entries • {render_stats['hits']} hits • {render_stats['misses']} misses",
+        inline=False
+    )
+    
+    refresh_lines = [
+        f"{name}: {job['runs']} runs, {job['failures']} failed, last {job['last_duration']:.2f}s"
+        for name, job in bot.scheduler.stats().items()
+    ]
+    embed.add_field(name="Background Refresh", value="\n".join(refresh_lines) or "None", inline=False)
+    
+    count_stats = bot.member_counts.stats()
+    embed.add_field(
+        name="Channel Member Counts",
+        value=f"{count_stats['channels']} channels in {count_stats['guilds']} guild(s) • {count_stats['recounts']} full recounts • {count_stats['stale']} stale",
+        inline=False
+    )
+    
+    page_stats = bot.page_sessions.stats()
+    embed.add_field(
+        name="Page Sessions",
+        value=f"{page_stats['sessions']} open ({page_stats['results']} results) • {page_stats['page_turns']} page turns • {page_stats['evicted']} evicted",
+        inline=False
+    )
+    
+    detail_stats = bot.api.detail_cache.stats()
+    embed.add_field(
+        name="Game Detail Cache",
+        value=f"{detail_stats['entries']} stored • {detail_stats['hits']} hits • {detail_stats['misses']} misses",
+        inline=False
+    )
     
     await ctx.send(embed=embed)
 
-@tasks.loop(hours=2) 
-async def auto_news_task():
-    """Automatically post new gaming news"""
-    if not bot.news_channel_id:
-        print(" Auto news skipped  no channel set")
-        return
+@bot.command(name="metrics")
+@commands.is_owner()
+async def show_metrics(ctx):
+    """Show command latencies, upstream calls and cache hit ratios (owner only)"""
+    def latency_line(label, histogram, extra=""):
+        return (
+            f"{label}: {histogram.count} • p50 {histogram.quantile(0.5) * 1000:.0f}ms • "
+            f"p95 {histogram.quantile(0.95) * 1000:.0f}ms{extra}"
+        )
+    
+    embed = discord.Embed(title="📈 Metrics", color=discord.Color.blue())
+    uptime = time.time() - metrics.started_at
+    embed.description = f"Uptime {uptime / 3600:.1f}h"
+    
+    command_hists = sorted(
+        ((dict(labels), hist) for labels, hist in metrics.histograms.get("command_seconds", {}).items()),
+        key=lambda item: -item[1].count
+    )
+    command_errors = {dict(labels)["command"]: value for labels, value in metrics.counters.get("command_errors_total", {}).items()}
+    command_lines = [
+        latency_line(
+            f"/{labels['command']}" + (" (ac)" if labels["kind"] == "autocomplete" else ""),
+            hist,
+            f" • {command_errors[labels['command']]:g} err" if labels["kind"] == "command" and labels["command"] in command_errors else ""
+        )
+        for labels, hist in command_hists[:12]
+    ]
+    embed.add_field(name="Commands", value="\n".join(command_lines)[:1024] or "None yet", inline=False)
+    
+    upstream_lines = []
+    for labels, hist in metrics.histograms.get("upstream_request_seconds", {}).items():
+        endpoint = dict(labels)["endpoint"]
+        statuses = ", ".join(
+            f"{dict(status_labels)['status']}×{value:g}"
+            for status_labels, value in metrics.counters.get("upstream_requests_total", {}).items()
+            if dict(status_labels)["endpoint"] == endpoint
+        )
+        received = metrics.counters.get("upstream_received_bytes_total", {}).get((("endpoint", endpoint),), 0)
+        coalesced = metrics.counters.get("upstream_coalesced_total", {}).get((("endpoint", endpoint),), 0)
+        upstream_lines.append(latency_line(
+            f"/{endpoint}", hist, f"\n  {statuses} • {received / 1024:.0f} KiB • {coalesced:g} coalesced"
+        ))
+    breaker = bot.api.breaker
+    upstream_lines.append(f"Circuit {breaker.state} • opened {breaker.times_opened}×")
+    embed.add_field(name="Upstream", value="\n".join(upstream_lines)[:1024], inline=False)
+    
+    news_hist = metrics.histogram("auto_news_seconds")
+    if news_hist:
+        outcomes = ", ".join(
+            f"{dict(labels)['outcome']}×{value:g}" for labels, value in metrics.counters.get("auto_news_runs_total", {}).items()
+        )
+        cadence = f"\n{outcomes} • every {bot.news_interval.current / 60:.0f} min"
+        embed.add_field(name="Auto News", value=latency_line("runs", news_hist, cadence), inline=False)
     
-    channel = bot.get_channel(bot.news_channel_id)
-    if not channel:
-        print(" Auto news skipped  channel not found")
+    cache_lines = [
+        f"{dict(labels)['cache']}: {value:.0%}"
+        for name, labels, value in metrics.gauges()
+        if name == "cache_hit_ratio"
+    ]
+    embed.add_field(name="Cache Hit Ratio", value=" • ".join(cache_lines) or "None", inline=False)
+    
+    if bot.metrics_server:
+        embed.set_footer(text=f"Full metrics: http://{METRICS_HOST}:{METRICS_PORT}/metrics")
+    await ctx.send(embed=embed)
+
+@tasks.loop(seconds=bot.news_interval.current)
+async def auto_news_task():
+    """Automatically post new gaming news to every subscribed channel, on an adaptive interval"""
+    if not len(bot.subscriptions):
+        logger.info(" Auto news skipped  no channel set")
+        metrics.inc("auto_news_runs_total", outcome="skipped")
         return
     
+    started = time.perf_counter()
+    outcome = "error"
     try:
-        from utils.api import GamingNewsBot
-        api = GamingNewsBot()
+        api = bot.api
         
         new_games = await api.get_new_games(limit=3)
         
@@ -101,33 +549,43 @@ async def auto_news_task():
             )
             
             for game in new_games:
-                title = game.get("title", "Unknown Game")
-                url = game.get("game_url", "")
-                short_desc = game.get("short_description", "No description available")
-                
-                if len(short_desc) > 100:
-                    short_desc = short_desc[:100] + "..."
-                
-                field_value = short_desc
-                if url:
-                    field_value += f"\n[🔗 Play Now]({url})"
-                
-                embed.add_field(
-                    name=f"🎮 {title}",
-                    value=field_value,
-                    inline=False
-                )
+                name, value = bot.renderer.alert_field(game)
+                embed.add_field(name=name, value=value, inline=False)
             
             embed.set_footer(text=f"Auto-update • Found {len(new_games)} new games")
-            await channel.send(embed=embed)
-            print(f"📰 Posted {len(new_games)} new games to channel {channel.name}")
+            
+            # Polled once per process; each shard then posts to its own guilds
+            report = await bot.fan_out_news(embed)
+            bot.last_fanout_report = report
+            metrics.inc("auto_news_games_total", len(new_games))
+            logger.info("📰 Posted %d new games: %s", len(new_games), report.summary())
+            outcome = "posted"
         else:
-            print("📰 No new games found")
+            logger.info("📰 No new games found")
+            outcome = "empty"
         
-        await api.close_session()
+        next_poll = bot.news_interval.record(len(new_games))
+        auto_news_task.change_interval(seconds=next_poll)
+        logger.info("📰 Next news check in %.0f min", next_poll / 60)
         
+    except UpstreamError as e:
+        # Not a quiet poll: keep the interval as it is and try again on schedule
+        logger.warning("📰 News check failed, MMOBomb unavailable: %s", e)
+        outcome = "failed"
     except Exception as e:
-        print(f"❌ Auto news error: {e}")
+        logger.error("❌ Auto news error: %s", e)
+    finally:
+        metrics.observe("auto_news_seconds", time.perf_counter() - started)
+        metrics.inc("auto_news_runs_total", outcome=outcome)
+
+@tasks.loop(seconds=30)
+async def flush_subscriptions_task():
+    """Write pending subscription changes, and detail cache read times, in one batch each"""
+    try:
+        bot.subscriptions.flush()
+        bot.api.detail_cache.flush()
+    except Exception as e:
+        logger.error("❌ Subscription flush error: %s", e)
 
 @bot.command(name="setchannel")
 @commands.has_permissions(manage_channels=True)
@@ -136,33 +594,41 @@ async def set_news_channel_prefix(ctx, channel: discord.TextChannel = None):
     if channel is None:
         channel = ctx.channel
     
-    bot.news_channel_id = channel.id
+    bot.subscriptions.add(ctx.guild.id, channel.id)
     await ctx.send(f" Auto news will be posted in {channel.mention}")
 
 async def load_extensions():
-    """Load all extensions"""
-    for ext in initial_extensions:
+    """Load all extensions concurrently (they don't depend on each other)"""
+    async def load(ext: str):
         try:
             await bot.load_extension(ext)
-            print(f"✅ Loaded {ext}")
+            logger.info("✅ Loaded %s", ext)
         except Exception as e:
-            print(f" Failed to load {ext}: {e}")
+            logger.error(" Failed to load %s: %s", ext, e)
+    
+    await asyncio.gather(*(load(ext) for ext in initial_extensions))
 
 async def main():
     """Main async function to run the bot"""
     if not DISCORD_TOKEN:
         return
     
-    await load_extensions()
+    setup_logging()
+    bot.startup.record("import", time.perf_counter() - _IMPORTS_STARTED)
+    with bot.startup.phase("cog setup"):
+        await load_extensions()
     
     try:
+        bot.startup.begin("gateway connect")
         await bot.start(DISCORD_TOKEN)
     except KeyboardInterrupt:
-        print(" Bot shutdown requested")
+        logger.info(" Bot shutdown requested")
         await bot.close()
     except Exception as e:
-        print(f"error: {e}")
+        logger.error("error: %s", e)
         await bot.close()
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
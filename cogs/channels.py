@@ -1,10 +1,61 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+from typing import Sequence
+from utils.pagination import page_footer, send_paginated
+
+# Channels listed per /list_channels page
+CHANNEL_PAGE_SIZE = 20
 
 class ChannelCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.member_counts = bot.member_counts
+
+    # Keep per-channel member counts current instead of rescanning members per command
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.member_counts.member_joined(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.member_counts.member_left(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        self.member_counts.member_updated(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        self.member_counts.channel_changed(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.member_counts.channel_deleted(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if before.overwrites != after.overwrites:
+            self.member_counts.channel_changed(after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.permissions != after.permissions:
+            self.member_counts.role_updated(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.member_counts.role_deleted(role)
+
+    @commands.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        if before.owner_id != after.owner_id:
+            self.member_counts.owner_changed(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.member_counts.forget(guild.id)
 
     @app_commands.command(name="create_channel", description="Create a new text channel in the server")
     @app_commands.describe(channel_name="Name of the channel to create")
@@ -86,38 +137,40 @@ class ChannelCog(commands.Cog):
             await interaction.response.send_message("❌ No text channels found in this server.", ephemeral=True)
             return
         
-        embed = discord.Embed(
-            title=f"📋 Channels in {guild.name}",
-            color=discord.Color.blue()
-        )
-        
         text_list = []
         for i, ch in enumerate(text_channels, 1):
-            members = len([m for m in ch.members if not m.bot])
+            members, _ = self.member_counts.counts(ch)
             text_list.append(f"{i}. {ch.mention} (`{ch.name}`) - {members} members")
         
-        text_chunks = []
-        current_chunk = ""
-        for channel_info in text_list:
-            if len(current_chunk + channel_info + "\n") > 1024:
+        def render(page_lines: Sequence[str], offset: int, page: int, pages: int) -> discord.Embed:
+            embed = discord.Embed(
+                title=f"📋 Channels in {guild.name}",
+                color=discord.Color.blue()
+            )
+            
+            text_chunks = []
+            current_chunk = ""
+            for channel_info in page_lines:
+                if len(current_chunk + channel_info + "\n") > 1024:
+                    text_chunks.append(current_chunk.strip())
+                    current_chunk = channel_info + "\n"
+                else:
+                    current_chunk += channel_info + "\n"
+            if current_chunk.strip():
                 text_chunks.append(current_chunk.strip())
-                current_chunk = channel_info + "\n"
-            else:
-                current_chunk += channel_info + "\n"
-        if current_chunk.strip():
-            text_chunks.append(current_chunk.strip())
-        
-        for i, chunk in enumerate(text_chunks):
-            field_name = "💬 Text Channels" if i == 0 else f"💬 Text Channels (cont. {i+1})"
-            embed.add_field(name=field_name, value=chunk, inline=False)
-        
-        if voice_channels:
-            voice_summary = f"🔊 **Voice Channels:** {len(voice_channels)} total"
-            embed.add_field(name="Voice Channels", value=voice_summary, inline=False)
-        
-        embed.set_footer(text=f"Total: {len(text_channels)} text channels • {len(voice_channels)} voice channels")
+            
+            for i, chunk in enumerate(text_chunks):
+                field_name = "💬 Text Channels" if i == 0 else f"💬 Text Channels (cont. {i+1})"
+                embed.add_field(name=field_name, value=chunk, inline=False)
+            
+            if voice_channels:
+                voice_summary = f"🔊 **Voice Channels:** {len(voice_channels)} total"
+                embed.add_field(name="Voice Channels", value=voice_summary, inline=False)
+            
+            embed.set_footer(text=page_footer(f"Total: {len(text_channels)} text channels • {len(voice_channels)} voice channels", page, pages))
+            return embed
         
-        await interaction.response.send_message(embed=embed)
+        await send_paginated(interaction, self.bot.page_sessions, text_list, render, CHANNEL_PAGE_SIZE)
 
     @app_commands.command(name="channel_info", description="Get detailed information about a channel")
     @app_commands.describe(channel="Channel to get info about (optional, defaults to current channel)")
@@ -135,8 +188,7 @@ class ChannelCog(commands.Cog):
         embed.add_field(name="📅 Created", value=f"<t:{int(channel.created_at.timestamp())}:R>", inline=True)
         embed.add_field(name="📍 Position", value=channel.position, inline=True)
         
-        members = len([m for m in channel.members if not m.bot])
-        bots = len([m for m in channel.members if m.bot])
+        members, bots = self.member_counts.counts(channel)
         embed.add_field(name="👥 Members", value=f"{members} humans, {bots} bots", inline=True)
         
         topic = channel.topic if channel.topic else "No topic set"
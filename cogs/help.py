@@ -29,7 +29,7 @@ class HelpCog(commands.Cog):
             name="🎮 Game Info Commands",
             value=(
                 "• `/gameinfo <id>` - Get detailed game info by ID\n"
-                "• `/topgames [category] [limit]` - Show top games\n"
+                "• `/topgames [category] [platform] [limit]` - Show top games\n"
                 "• `/randomgame` - Get a random game recommendation"
             ),
             inline=False
@@ -59,7 +59,7 @@ class HelpCog(commands.Cog):
         embed.add_field(
             name="💡 Pro Tips",
             value=(
-                "• Auto news updates every 2 hours when channel is set\n"
+                "• Auto news updates as new games appear when channel is set\n"
                 "• Use game IDs from `/topgames` with `/gameinfo`\n"
                 "• Categories: mmorpg, shooter, moba, battle-royale, etc."
             ),
@@ -85,7 +85,7 @@ class HelpCog(commands.Cog):
             value=(
                 "• Real-time gaming news from MMOBomb\n"
                 "• Detailed game information and stats\n"
-                "• Automatic news updates every 2 hours\n"
+                "• Automatic news updates as new games appear\n"
                 "• Game search and recommendations\n"
                 "• Channel management tools"
             ),
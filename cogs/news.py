@@ -1,12 +1,30 @@
+import logging
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils.api import GamingNewsBot
+from typing import List, Sequence
+from utils.pagination import page_footer, send_paginated
+
+logger = logging.getLogger(__name__)
+
+# Ranked matches kept for paging through /searchgame results, shown five at a time
+SEARCH_RESULTS = 25
+SEARCH_PAGE_SIZE = 5
 
 class NewsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.api = GamingNewsBot()
+        self.api = bot.api
+
+    # Drop subscriptions that can never be delivered to again
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.bot.subscriptions.remove(channel.guild.id, channel.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.bot.subscriptions.remove(guild.id)
 
     @app_commands.command(name="latestnews", description="Get the latest gaming news")
     @app_commands.describe(limit="Number of games to show (max 10, default 5)")
@@ -33,19 +51,7 @@ class NewsCog(commands.Cog):
             )
             
             for i, article in enumerate(news_list, 1):
-                title = article.get("title", "Unknown Game")
-                url = article.get("game_url", "")
-                genre = article.get("genre", "Unknown")
-                platform = article.get("platform", "PC")
-                short_desc = article.get("short_description", "")
-                
-                value = f"**Genre:** {genre} | **Platform:** {platform}"
-                if short_desc:
-                    desc = short_desc[:80] + "..." if len(short_desc) > 80 else short_desc
-                    value += f"\n{desc}"
-                if url:
-                    value += f"\n[🎮 Play Now]({url})"
-                
+                title, value = self.bot.renderer.news_field(article)
                 embed.add_field(
                     name=f"{i}. {title}",
                     value=value,
@@ -56,10 +62,8 @@ class NewsCog(commands.Cog):
             await interaction.followup.send(embed=embed)
             
         except Exception as e:
-            print(f"Error in latest_news: {e}")
+            logger.error("Error in latest_news: %s", e, extra={"command": "latestnews", "guild": interaction.guild_id})
             await interaction.followup.send("❌ Something went wrong fetching the news!", ephemeral=True)
-        finally:
-            await self.api.close_session()
 
     @app_commands.command(name="setchannel", description="Set channel for auto news updates")
     @app_commands.describe(channel="Channel to send auto news to (optional, defaults to current channel)")
@@ -72,7 +76,7 @@ class NewsCog(commands.Cog):
         if channel is None:
             channel = interaction.channel
         
-        self.bot.news_channel_id = channel.id
+        self.bot.subscriptions.add(interaction.guild_id, channel.id)
         
         embed = discord.Embed(
             title="✅ News Channel Set!",
@@ -81,7 +85,7 @@ class NewsCog(commands.Cog):
         )
         embed.add_field(
             name="ℹ️ Info", 
-            value="New games will be automatically posted every 2 hours!",
+            value="New games will be automatically posted as they appear!",
             inline=False
         )
         embed.add_field(
@@ -105,58 +109,61 @@ class NewsCog(commands.Cog):
                 await interaction.followup.send("❌ Could not fetch games list right now!", ephemeral=True)
                 return
             
-            matching_games = [
-                game for game in games 
-                if game_name.lower() in game.get("title", "").lower()
-            ]
+            # Ranked matches from the catalog search index
+            matching_games = await self.api.search_games(game_name, limit=SEARCH_RESULTS)
             
             if not matching_games:
                 await interaction.followup.send(f"❌ No games found matching '{game_name}'", ephemeral=True)
                 return
             
-            # Take the first 5 matches
-            matching_games = matching_games[:5]
+            found = len(matching_games)
             
-            embed = discord.Embed(
-                title=f"🔍 Search Results for '{game_name}'",
-                description=f"Found {len(matching_games)} matching games:",
-                color=discord.Color.blue()
-            )
-            
-            for game in matching_games:
-                title = game.get("title", "Unknown")
-                genre = game.get("genre", "Unknown")
-                platform = game.get("platform", "PC")
-                game_id = game.get("id", "N/A") 
-                url = game.get("game_url", "")
+            def render(page_games: Sequence, offset: int, page: int, pages: int) -> discord.Embed:
+                embed = discord.Embed(
+                    title=f"🔍 Search Results for '{game_name}'",
+                    description=f"Found {found} matching games:",
+                    color=discord.Color.blue()
+                )
                 
-                value = f"**Genre:** {genre} | **Platform:** {platform} | **ID:** {game_id}"
-                if url:
-                    value += f"\n[🎮 Play Now]({url})"
+                for game in page_games:
+                    title, value = self.bot.renderer.list_field(game)
+                    embed.add_field(name=title, value=value, inline=False)
                 
-                embed.add_field(name=title, value=value, inline=False)
+                embed.set_footer(text=page_footer("💡 Tip: Use /gameinfo <ID> to get detailed info about any game!", page, pages))
+                return embed
             
-            embed.set_footer(text="💡 Tip: Use /gameinfo <ID> to get detailed info about any game!")
-            await interaction.followup.send(embed=embed)
+            await send_paginated(interaction, self.bot.page_sessions, matching_games, render, SEARCH_PAGE_SIZE)
             
         except Exception as e:
-            print(f"Error in search_game: {e}")
+            logger.error("Error in search_game: %s", e, extra={"command": "searchgame", "guild": interaction.guild_id})
             await interaction.followup.send("❌ Error searching for games!", ephemeral=True)
-        finally:
-            await self.api.close_session()
+
+    @search_game.autocomplete("game_name")
+    async def search_game_autocomplete(self, interaction: discord.Interaction, current: str) -> List[app_commands.Choice[str]]:
+        """Suggest game titles from the cached catalog"""
+        games = self.api.autocomplete_games(current)
+        return [
+            app_commands.Choice(name=(game.title or "Unknown")[:100], value=(game.title or "Unknown")[:100])
+            for game in games
+        ]
 
     @app_commands.command(name="newsoff", description="Turn off auto news for this server")
-    async def turn_off_news(self, interaction: discord.Interaction):
+    @app_commands.describe(channel="Only stop news in this channel (optional, defaults to every channel)")
+    async def turn_off_news(self, interaction: discord.Interaction, channel: discord.TextChannel = None):
         """Slash command: Turn off auto news"""
         if not interaction.user.guild_permissions.manage_channels:
             await interaction.response.send_message("❌ You need 'Manage Channels' permission to use this!", ephemeral=True)
             return
         
-        self.bot.news_channel_id = None
+        self.bot.subscriptions.remove(interaction.guild_id, channel.id if channel else None)
         
+        description = (
+            f"Auto news updates have been turned off for {channel.mention}."
+            if channel else "Auto news updates have been turned off for this server."
+        )
         embed = discord.Embed(
             title="🔕 Auto News Disabled",
-            description="Auto news updates have been turned off for this server.",
+            description=description,
             color=discord.Color.orange()
         )
         embed.add_field(
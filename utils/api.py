@@ -1,137 +1,588 @@
+import os
+import sys
 import aiohttp
 import asyncio
-from typing import Optional, List, Dict
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, List, Dict, Tuple
+from utils.cache import TTLCache
+from utils.catalog_index import CatalogIndex
+from utils.detail_cache import DetailCache
+from utils.diff import CatalogDiff, diff_catalog
+from utils.jsonstream import JsonArrayStream
+from utils.metrics import metrics
+from utils.resilience import CircuitBreaker, RequestPolicy, UpstreamError
+from utils.seen import SeenIds
+from utils.search import SearchIndex
 
-MMO_API_BASE_URL = "https://www.mmobomb.com/api1"
+logger = logging.getLogger(__name__)
+
+MMO_API_BASE_URL = os.getenv("MMO_API_BASE_URL", "https://www.mmobomb.com/api1")
+
+# Connection pool tuning for the shared session
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 10
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+# Per-endpoint latency budgets: timeout per attempt and total time including retries.
+# /game backs an interactive command, /games is mostly refreshed in the background.
+UPSTREAM_RETRIES = int(os.getenv("UPSTREAM_RETRIES", "2"))
+ENDPOINT_POLICIES: Dict[str, RequestPolicy] = {
+    "games": RequestPolicy(attempt_timeout=8, budget=15, retries=UPSTREAM_RETRIES),
+    "game": RequestPolicy(attempt_timeout=4, budget=8, retries=UPSTREAM_RETRIES),
+}
+DEFAULT_POLICY = RequestPolicy(attempt_timeout=5, budget=10, retries=UPSTREAM_RETRIES)
+
+# Circuit breaker: consecutive failed requests before failing fast, seconds before a trial request
+BREAKER_THRESHOLD = int(os.getenv("UPSTREAM_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("UPSTREAM_BREAKER_RESET_SECONDS", "30"))
+
+# Catalog cache: entries are served fresh for the TTL, then stale while refreshing
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+CATALOG_CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "32"))
+
+# Persistent game detail cache (seconds a record is trusted before revalidation)
+DETAIL_CACHE_PATH = os.getenv("DETAIL_CACHE_PATH", os.path.join("data", "game_details.sqlite3"))
+DETAIL_CACHE_TTL = float(os.getenv("DETAIL_CACHE_TTL", "86400"))
+DETAIL_CACHE_SIZE = int(os.getenv("DETAIL_CACHE_SIZE", "2000"))
+
+# Game ids already announced by auto news, kept across restarts
+SEEN_IDS_PATH = os.getenv("SEEN_IDS_PATH", os.path.join("data", "seen_game_ids.bin"))
+SEEN_IDS_HORIZON = int(os.getenv("SEEN_IDS_HORIZON", "5000"))
+
+# /games responses are decoded in chunks of this size as they arrive
+STREAM_CHUNK_SIZE = 64 * 1024
+
+CatalogKey = Tuple[Optional[str], Optional[str], Optional[str]]
+FULL_CATALOG: CatalogKey = (None, None, None)
+LATEST_GAMES: CatalogKey = (None, None, "release-date")
+
+
+class Game:
+    """Compact, typed MMOBomb game record.
+
+    Uses `__slots__` instead of a per-record dict, and interns values that
+    repeat across the catalog (genre, platform, publisher, ...) so thousands
+    of records share one copy of each string. Unknown keys are dropped.
+    """
+
+    __slots__ = (
+        "id", "title", "thumbnail", "short_description", "game_url", "genre",
+        "platform", "publisher", "developer", "release_date", "profile_url",
+        "description", "status",
+    )
+    _INTERNED = frozenset(("genre", "platform", "publisher", "developer", "release_date", "status"))
+
+    def __init__(self, game_id: int, **fields):
+        self.id = game_id
+        for name in self.__slots__[1:]:
+            value = fields.get(name)
+            if name in self._INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> Optional["Game"]:
+        """Build a record from API JSON; returns None if it has no usable id"""
+        try:
+            game_id = int(data["id"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return cls(game_id, **data)
+
+    def to_dict(self) -> Dict:
+        """Plain dict of the set fields (for persistence and fingerprinting)"""
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
+
+    def __repr__(self) -> str:
+        return f"<Game id={self.id} title={self.title!r}>"
 
 
 class GamingNewsBot:
-    def __init__(self):
+    def __init__(self, base_url: str = None):
+        self.base_url = (base_url or MMO_API_BASE_URL).rstrip("/")
         self.session: Optional[aiohttp.ClientSession] = None
         self.news_cache: List[Dict] = []
         self.last_update = None
-        self.previous_news_ids: set[int] = set()
+        self.seen_ids = SeenIds(SEEN_IDS_PATH, horizon=SEEN_IDS_HORIZON)
+        self.catalog_cache = TTLCache(ttl=CATALOG_CACHE_TTL, max_entries=CATALOG_CACHE_SIZE)
+        self._refresh_tasks: Dict[CatalogKey, asyncio.Task] = {}
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self.search_index = SearchIndex()
+        self.catalog_index = CatalogIndex()
+        self.catalog_snapshot: Dict[int, int] = {}
+        self.last_catalog_diff: Optional[CatalogDiff] = None
+        self._unannounced: Dict[int, Game] = {}
+        self.catalog_listeners: List[Callable[[CatalogDiff], None]] = []
+        self.detail_listeners: List[Callable[[int], None]] = []
+        self.detail_cache = DetailCache(DETAIL_CACHE_PATH, ttl=DETAIL_CACHE_TTL, max_entries=DETAIL_CACHE_SIZE)
+        self.breaker = CircuitBreaker(BREAKER_THRESHOLD, BREAKER_RESET_SECONDS)
+        # Last successful download of each list, kept after cache invalidation to serve when upstream is down
+        self.last_good = TTLCache(ttl=float("inf"), max_entries=CATALOG_CACHE_SIZE)
+        # ETag/Last-Modified of each last good list, for conditional refreshes
+        self._validators: Dict[CatalogKey, Tuple[Optional[str], Optional[str]]] = {}
+        self._diffed_catalog: Optional[List[Game]] = None
 
     async def create_session(self):
-        """Create aiohttp session if not already created"""
+        """Create the pooled aiohttp session if not already created.
+
+        The session is meant to live as long as the bot so that connections
+        to MMOBomb are kept alive and reused between commands.
+        """
         if not self.session or self.session.closed:
-            timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Requests set their own per-endpoint timeouts; this only bounds anything that doesn't
+            timeout = aiohttp.ClientTimeout(total=DEFAULT_POLICY.budget)
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
     async def close_session(self):
-        """Close aiohttp session if open"""
+        """Close aiohttp session if open (call once on shutdown)"""
+        for task in self._refresh_tasks.values():
+            task.cancel()
+        self._refresh_tasks.clear()
+
+        self.detail_cache.close()
+
         if self.session and not self.session.closed:
             await self.session.close()
             self.session = None
 
-    async def _make_request(self, url: str, params: Dict = None) -> Dict:
-        """Make an HTTP request with error handling"""
+    async def _make_request(
+        self, url: str, params: Dict = None, headers: Dict = None,
+        decode: Callable[[aiohttp.ClientResponse], Awaitable[Tuple[object, int]]] = None, variant=None,
+    ) -> Tuple[int, object, Dict]:
+        """`_get`, sharing one upstream call between identical concurrent requests.
+
+        Requests are identical when URL, params, headers (validators included)
+        and `variant` match; pass anything that changes how `decode` reads
+        the response, such as a read limit, as the variant.
+        """
+        key = (
+            url,
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+            variant,
+        )
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(url, params, headers, decode))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            metrics.inc("upstream_coalesced_total", endpoint=self._endpoint(url))
+        
+        # Shield so a cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _read_json(resp: aiohttp.ClientResponse) -> Tuple[Dict, int]:
+        body = await resp.read()
+        return await resp.json() or {}, len(body)
+
+    @staticmethod
+    async def _read_games(resp: aiohttp.ClientResponse, limit: int = None) -> Tuple[List[Game], int]:
+        """Build Game records while the /games array is still downloading.
+
+        Never holds the whole body or the list of raw dicts, and with a limit
+        stops reading as soon as enough games have arrived (the rest of the
+        body is discarded with the connection).
+        """
+        stream = JsonArrayStream()
+        games: List[Game] = []
+        async for chunk in resp.content.iter_chunked(STREAM_CHUNK_SIZE):
+            for item in stream.feed(chunk):
+                game = Game.from_dict(item) if isinstance(item, dict) else None
+                if game is not None:
+                    games.append(game)
+                    if limit and len(games) >= limit:
+                        return games, stream.received
+        for item in stream.close():
+            game = Game.from_dict(item) if isinstance(item, dict) else None
+            if game is not None:
+                games.append(game)
+        return games, stream.received
+
+    async def _get(
+        self, url: str, params: Dict = None, headers: Dict = None,
+        decode: Callable[[aiohttp.ClientResponse], Awaitable[Tuple[object, int]]] = None,
+    ) -> Tuple[int, Dict, Dict]:
+        """GET with the endpoint's latency budget, jittered retries and the circuit breaker.
+
+        Returns (status, data, response headers) once MMOBomb answers with
+        anything but a server error. Timeouts, connection errors, 5xx and 429
+        are retried within the budget; if they persist (or the circuit is
+        open) UpstreamError is raised. `decode` turns a 200 response into
+        (data, bytes read); the default reads the whole body as JSON.
+        """
+        endpoint = self._endpoint(url)
+        policy = ENDPOINT_POLICIES.get(endpoint, DEFAULT_POLICY)
+        if not self.breaker.allow():
+            metrics.inc("upstream_short_circuited_total", endpoint=endpoint)
+            raise UpstreamError(f"/{endpoint}: circuit open")
+        
         await self.create_session()
+        deadline = time.monotonic() + policy.budget
+        error = "no attempt made"
         
-        try:
-            async with self.session.get(url, params=params) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data if data else {}
-                else:
-                    print(f"API request failed: {resp.status}")
-                    return {}
-        except asyncio.TimeoutError:
-            print("Request timed out")
-            return {}
-        except Exception as e:
-            print(f"Request error: {e}")
-            return {}
+        for attempt in range(policy.retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            started = time.perf_counter()
+            status, received = "error", 0
+            try:
+                timeout = aiohttp.ClientTimeout(total=min(policy.attempt_timeout, remaining))
+                async with self.session.get(url, params=params, headers=headers, timeout=timeout) as resp:
+                    status = resp.status
+                    if resp.status < 500 and resp.status != 429:
+                        data = {}
+                        if resp.status == 200:
+                            data, received = await (decode or self._read_json)(resp)
+                        elif resp.status != 304:
+                            logger.warning("API request failed: %s", resp.status, extra={"endpoint": endpoint, "status": resp.status})
+                        self.breaker.record_success()
+                        return resp.status, data, resp.headers.copy()
+                    error = f"HTTP {resp.status}"
+            except asyncio.TimeoutError:
+                status = "timeout"
+                error = "timed out"
+            except Exception as e:
+                error = str(e) or type(e).__name__
+            finally:
+                self._record_request(url, status, started, received)
+            
+            logger.warning(
+                "Request error: %s", error,
+                extra={"endpoint": endpoint, "status": status, "attempt": attempt + 1}
+            )
+            if attempt < policy.retries:
+                metrics.inc("upstream_retries_total", endpoint=endpoint)
+                await asyncio.sleep(min(policy.delay(attempt), max(0.0, deadline - time.monotonic())))
+        
+        self.breaker.record_failure()
+        raise UpstreamError(f"/{endpoint}: {error}")
+    
+    @staticmethod
+    def _endpoint(url: str) -> str:
+        return url.rsplit("/", 1)[-1]
+    
+    def _record_request(self, url: str, status, started: float, received: int):
+        """Record latency, status code and bytes received for one upstream call"""
+        endpoint = self._endpoint(url)
+        elapsed = time.perf_counter() - started
+        metrics.observe("upstream_request_seconds", elapsed, endpoint=endpoint)
+        metrics.inc("upstream_requests_total", endpoint=endpoint, status=status)
+        if received:
+            metrics.inc("upstream_received_bytes_total", received, endpoint=endpoint)
+        if status not in (200, 304):
+            metrics.inc("upstream_errors_total", endpoint=endpoint)
+        logger.debug(
+            "Upstream %s: %s", endpoint, status,
+            extra={"endpoint": endpoint, "status": status, "latency_ms": round(elapsed * 1000, 1), "bytes": received}
+        )
+
+    async def _download_games_list(self, key: CatalogKey, limit: int = None) -> List[Game]:
+        """Download a games list from the API, bypassing the cache; raises UpstreamError on failure.
 
-    async def fetch_games_list(self, category: str = None, platform: str = None) -> List[Dict]:
-        """Fetch list of games by category/platform"""
-        url = f"{MMO_API_BASE_URL}/games"
+        With a limit only the first `limit` games are read from the response.
+        """
+        category, platform, sort = key
+        url = f"{self.base_url}/games"
         params: Dict[str, str] = {}
         
         if category:
             params["category"] = category
         if platform:
             params["platform"] = platform
+        if sort:
+            params["sort-by"] = sort
+        
+        # Revalidate instead of re-downloading when we hold a list MMOBomb gave validators for
+        last_good = self.last_good.get(key)
+        etag, last_modified = self._validators.get(key, (None, None)) if last_good is not None else (None, None)
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
             
-        result = await self._make_request(url, params)
-        return result if isinstance(result, list) else []
+        status, games, response_headers = await self._make_request(
+            url, params, headers, decode=lambda resp: self._read_games(resp, limit), variant=limit
+        )
+        if status == 304 and last_good is not None:
+            metrics.inc("upstream_not_modified_total", endpoint="games")
+            return last_good[0][:limit] if limit else last_good[0]
+        if not isinstance(games, list):
+            return []
+        if games and not limit:
+            self.last_good.set(key, games)
+            self._validators[key] = (response_headers.get("ETag"), response_headers.get("Last-Modified"))
+        return games
 
-    async def fetch_game_details(self, game_id: int) -> Dict:
-        """Fetch detailed info for a specific game"""
-        url = f"{MMO_API_BASE_URL}/game"
-        params = {"id": game_id}
+    def _last_good_games_list(self, key: CatalogKey, error: Exception) -> List[Game]:
+        """Fallback when a download fails: the last list MMOBomb gave us for this key, if any"""
+        last_good = self.last_good.get(key)
+        if last_good is None:
+            logger.warning("No games list to fall back on: %s", error)
+            return []
+        metrics.inc("upstream_fallbacks_total")
+        logger.warning("Serving last good games list: %s", error)
+        return last_good[0]
+
+    async def _refresh_games_list(self, key: CatalogKey):
+        """Background refresh for a stale catalog entry"""
+        try:
+            games = await self._download_games_list(key)
+            self._store_games_list(key, games)
+        except Exception as e:
+            logger.error("Catalog refresh error: %s", e)
+        finally:
+            self._refresh_tasks.pop(key, None)
+
+    async def fetch_games_list(self, category: str = None, platform: str = None, sort: str = None, genre: str = None) -> List[Game]:
+        """Fetch list of games by category/platform/genre, served from the catalog cache.
+
+        Unsorted filtered listings are answered from the local catalog indexes
+        instead of a separate upstream request per filter.
+        """
+        if not sort and (category or platform or genre):
+            await self.fetch_games_list()
+            return self.catalog_index.filter(category=category, platform=platform, genre=genre)
+        
+        key: CatalogKey = (category or None, platform or None, sort or None)
         
-        result = await self._make_request(url, params)
-        return result if isinstance(result, dict) else {}
+        cached = self.catalog_cache.get(key)
+        if cached is not None:
+            games, fresh = cached
+            if not fresh and key not in self._refresh_tasks:
+                self._refresh_tasks[key] = asyncio.create_task(self._refresh_games_list(key))
+            return games
+        
+        try:
+            games = await self._download_games_list(key)
+        except UpstreamError as e:
+            return self._last_good_games_list(key, e)
+        self._store_games_list(key, games)
+        return games
 
-    async def fetch_latest_games(self, limit: int = 10) -> List[Dict]:
-        """Fetch latest games (sorted by release date)"""
-        url = f"{MMO_API_BASE_URL}/games"
-        params = {"sort-by": "release-date"}
+    def _store_games_list(self, key: CatalogKey, games: List[Game]) -> CatalogDiff:
+        """Cache a downloaded list; for the full catalog, diff it and apply the delta"""
+        if not games:
+            return CatalogDiff(snapshot=self.catalog_snapshot)
+        self.catalog_cache.set(key, games)
+        if key != FULL_CATALOG:
+            return CatalogDiff(snapshot=self.catalog_snapshot)
+        
+        if games is self._diffed_catalog:
+            # Same list object as last time: the download was answered with 304 Not Modified
+            return CatalogDiff(snapshot=self.catalog_snapshot)
+        self._diffed_catalog = games
+        
+        baseline = not self.catalog_snapshot
+        diff = diff_catalog(self.catalog_snapshot, games)
+        self.catalog_snapshot = diff.snapshot
+        if diff:
+            self.last_catalog_diff = diff
+            self.catalog_index.rebuild(games)
+            self._apply_catalog_diff(diff, baseline)
+        return diff
+
+    def _apply_catalog_diff(self, diff: CatalogDiff, baseline: bool = False):
+        """Update everything derived from the catalog using only the changed games.
+
+        `baseline` marks the first diff in this process, against an empty
+        snapshot, in which every catalog game shows up as added.
+        """
+        self.search_index.apply_diff(diff)
+        
+        # On the baseline, ids missing from the seen state may just have been trimmed past its
+        # horizon; only ids above the newest one it holds were added while the bot was down
+        newest_seen = self.seen_ids.highest() if baseline else None
+        for game in diff.added:
+            if game.id not in self.seen_ids and (newest_seen is None or game.id > newest_seen):
+                self._unannounced[game.id] = game
+        for game_id in diff.removed:
+            self._unannounced.pop(game_id, None)
+        
+        stale_ids = [game.id for game in diff.changed] + diff.removed
+        if stale_ids:
+            self.detail_cache.expire(stale_ids)
+        
+        # Filtered lists were derived from the old catalog; drop them so they refetch
+        for key in [k for k in self.catalog_cache.keys() if k != FULL_CATALOG]:
+            self.catalog_cache.invalidate(key)
+        
+        for listener in self.catalog_listeners:
+            try:
+                listener(diff)
+            except Exception as e:
+                logger.error("Catalog listener error: %s", e)
+
+    def _notify_detail_changed(self, game_id: int):
+        for listener in self.detail_listeners:
+            try:
+                listener(game_id)
+            except Exception as e:
+                logger.error("Detail listener error: %s", e)
+
+    async def refresh_catalog(self) -> CatalogDiff:
+        """Download the full catalog now and return what changed since the last snapshot"""
+        games = await self._download_games_list(FULL_CATALOG)
+        return self._store_games_list(FULL_CATALOG, games)
+
+    async def refresh_latest_games(self) -> List[Game]:
+        """Download the release-date sorted list now, bypassing the cache"""
+        games = await self._download_games_list(LATEST_GAMES)
+        self._store_games_list(LATEST_GAMES, games)
+        return games
+
+    async def _conditional_request(self, url: str, params: Dict, etag: str = None, last_modified: str = None) -> Tuple[int, Dict, Dict]:
+        """GET with If-None-Match/If-Modified-Since; returns (status, data, response headers), status 0 on failure"""
+        headers: Dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
         
-        result = await self._make_request(url, params)
+        try:
+            # Concurrent lookups of the same game (and validators) share one request
+            return await self._make_request(url, params, headers)
+        except UpstreamError as e:
+            logger.warning("Conditional request failed: %s", e)
+            return 0, {}, {}
+
+    @staticmethod
+    def _max_age(headers: Dict) -> Optional[float]:
+        """max-age from a Cache-Control header, if the upstream sent one"""
+        for directive in headers.get("Cache-Control", "").split(","):
+            name, _, value = directive.strip().partition("=")
+            if name.lower() == "max-age" and value.isdigit():
+                return float(value)
+        return None
+
+    async def fetch_game_details(self, game_id: int) -> Optional[Game]:
+        """Fetch detailed info for a specific game, served from the local detail cache when fresh"""
+        entry = self.detail_cache.get(game_id)
+        if entry is not None and entry.fresh:
+            return Game.from_dict(entry.data)
+        
+        url = f"{self.base_url}/game"
+        params = {"id": game_id}
         
-        if isinstance(result, list) and result:
+        status, result, headers = await self._conditional_request(
+            url, params,
+            etag=entry.etag if entry else None,
+            last_modified=entry.last_modified if entry else None,
+        )
+        
+        if status == 304 and entry is not None:
+            self.detail_cache.touch(game_id, headers.get("ETag"), headers.get("Last-Modified"), self._max_age(headers))
+            return Game.from_dict(entry.data)
+        
+        game = Game.from_dict(result) if status == 200 and isinstance(result, dict) else None
+        if game is not None:
+            data = game.to_dict()
+            self.detail_cache.set(game_id, data, headers.get("ETag"), headers.get("Last-Modified"), self._max_age(headers))
+            # No row to compare against (first fetch, or evicted) counts as changed: a render may outlive the row
+            if entry is None or entry.data != data:
+                self._notify_detail_changed(game_id)
+            return game
+        
+        # Upstream failed: an expired record is still better than nothing
+        if entry is not None:
+            return Game.from_dict(entry.data)
+        return None
+
+    async def fetch_latest_games(self, limit: int = 10) -> List[Game]:
+        """Fetch latest games (sorted by release date)"""
+        if LATEST_GAMES in self.catalog_cache:
+            result = await self.fetch_games_list(sort="release-date")
             return result[:limit]
-        return []
+        
+        # Cold cache: read just the first few games off the stream, fill the cache in the background
+        try:
+            games = await self._download_games_list(LATEST_GAMES, limit=limit)
+        except UpstreamError as e:
+            return self._last_good_games_list(LATEST_GAMES, e)[:limit]
+        if LATEST_GAMES not in self._refresh_tasks:
+            self._refresh_tasks[LATEST_GAMES] = asyncio.create_task(self._refresh_games_list(LATEST_GAMES))
+        return games
+
+    def autocomplete_games(self, current: str, limit: int = 25) -> List[Game]:
+        """Autocomplete games from the in-memory index without waiting on the API"""
+        if not len(self.search_index) and FULL_CATALOG not in self._refresh_tasks:
+            # Cold start: load the catalog in the background for the next keystroke
+            self._refresh_tasks[FULL_CATALOG] = asyncio.create_task(self._refresh_games_list(FULL_CATALOG))
+        return self.search_index.complete(current, limit)
 
-    async def get_new_games(self, limit: int = 5) -> List[Dict]:
-        """Get new games that were not cached before"""
+    async def get_new_games(self, limit: int = 5) -> List[Game]:
+        """Get new games that were not announced before, newest release first.
+
+        Works from the catalog delta: only games added since the last snapshot
+        (and not yet announced) are considered. Raises UpstreamError if the
+        catalog could not be downloaded, so a failed poll isn't mistaken for a
+        quiet one.
+        """
         try:
-            current_games = await self.fetch_latest_games(limit * 3)  
-            new_games: List[Dict] = []
-            current_ids: set[int] = set()
-
-            for game in current_games:
-                game_id = game.get("id")
-                if not game_id:
-                    continue
-                    
-                current_ids.add(game_id)
-                
-                if game_id not in self.previous_news_ids:
-                    new_games.append(game)
-                    
-                if len(new_games) >= limit:
-                    break
-
-            self.previous_news_ids.update(current_ids)
+            await self.refresh_catalog()
+            
+            pending = sorted(
+                self._unannounced.values(),
+                key=lambda game: game.release_date or "",
+                reverse=True
+            )
+            new_games = pending[:limit]
+            
+            if not len(self.seen_ids):
+                # First run ever: announce only the latest few, treat the rest as already known
+                announced = pending
+            else:
+                announced = new_games
+            
+            for game in announced:
+                self._unannounced.pop(game.id, None)
+            if self.seen_ids.add(game.id for game in announced):
+                self.seen_ids.save()
             
             return new_games
             
+        except UpstreamError:
+            raise
         except Exception as e:
-            print(f"Error getting new games: {e}")
+            logger.error("Error getting new games: %s", e)
             return []
 
-    async def search_games(self, search_term: str, limit: int = 5) -> List[Dict]:
-        """Search for games by title"""
+    async def search_games(self, search_term: str, limit: int = 5) -> List[Game]:
+        """Search for games by title, best matches first"""
         try:
-            all_games = await self.fetch_games_list()
-            
-            matching_games = [
-                game for game in all_games 
-                if search_term.lower() in game.get("title", "").lower()
-            ]
-            
-            return matching_games[:limit]
+            await self.fetch_games_list()
+            return self.search_index.search(search_term, limit)
             
         except Exception as e:
-            print(f"Error searching games: {e}")
+            logger.error("Error searching games: %s", e)
             return []
 
-    async def get_games_by_platform(self, platform: str, limit: int = 10) -> List[Dict]:
+    async def get_games_by_platform(self, platform: str, limit: int = 10) -> List[Game]:
         """Get games filtered by platform"""
         try:
             games = await self.fetch_games_list(platform=platform)
             return games[:limit]
         except Exception as e:
-            print(f"Error getting games by platform: {e}")
+            logger.error("Error getting games by platform: %s", e)
             return []
 
-    async def get_random_games(self, count: int = 1) -> List[Dict]:
+    async def get_random_games(self, count: int = 1) -> List[Game]:
         """Get random games"""
         try:
-            import random
             all_games = await self.fetch_games_list()
             
             if len(all_games) < count:
@@ -140,5 +591,5 @@ class GamingNewsBot:
             return random.sample(all_games, count)
             
         except Exception as e:
-            print(f"Error getting random games: {e}")
+            logger.error("Error getting random games: %s", e)
             return []
\ No newline at end of file
@@ -0,0 +1,107 @@
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from utils.api import Game
+
+_NON_SLUG = re.compile(r"[^0-9a-z]+")
+
+# MMOBomb category slugs that don't match the slugified genre name
+CATEGORY_ALIASES = {
+    "card-game": "card",
+    "mmofps": "shooter",
+    "mmotps": "shooter",
+}
+
+
+def slugify(text: str) -> str:
+    return _NON_SLUG.sub("-", (text or "").lower()).strip("-")
+
+
+def category_of(genre: str) -> str:
+    slug = slugify(genre)
+    return CATEGORY_ALIASES.get(slug, slug)
+
+
+def platforms_of(platform: str) -> Set[str]:
+    """Map a platform string like "PC (Windows), Web Browser" to API platform slugs"""
+    text = (platform or "").lower()
+    found: Set[str] = set()
+    if "windows" in text or "pc" in text:
+        found.add("pc")
+    if "browser" in text:
+        found.add("browser")
+    return found
+
+
+class _Posting:
+    __slots__ = ("games", "ids")
+
+    def __init__(self):
+        self.games: List["Game"] = []
+        self.ids: Set[int] = set()
+
+    def add(self, game: "Game"):
+        self.games.append(game)
+        self.ids.add(game.id)
+
+
+class CatalogIndex:
+    """Inverted indexes over the full catalog by category, platform and genre.
+
+    Rebuilt whenever the catalog changes so filtered listings (including
+    combinations like shooter + browser) are answered locally, in catalog
+    order, without another upstream request.
+    """
+
+    def __init__(self, games: Iterable["Game"] = ()):
+        self.rebuild(games)
+
+    def rebuild(self, games: Iterable["Game"]):
+        self._all: List["Game"] = []
+        self._category: Dict[str, _Posting] = {}
+        self._platform: Dict[str, _Posting] = {}
+        self._genre: Dict[str, _Posting] = {}
+
+        for game in games:
+            self._all.append(game)
+            if game.genre:
+                self._category.setdefault(category_of(game.genre), _Posting()).add(game)
+                self._genre.setdefault(game.genre.lower(), _Posting()).add(game)
+            for platform in platforms_of(game.platform):
+                self._platform.setdefault(platform, _Posting()).add(game)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def categories(self) -> List[str]:
+        return sorted(self._category)
+
+    def filter(self, category: str = None, platform: str = None, genre: str = None, limit: Optional[int] = None) -> List["Game"]:
+        """Games matching every given filter, in catalog order.
+
+        Walks the smallest matching posting list and checks the others by id,
+        so the cost is proportional to the result, not the catalog.
+        """
+        postings: List[_Posting] = []
+        if category:
+            postings.append(self._category.get(category_of(category)))
+        if platform and platform != "all":
+            postings.append(self._platform.get(platform.lower()))
+        if genre:
+            postings.append(self._genre.get(genre.lower()))
+
+        if not postings:
+            return self._all[:limit] if limit else list(self._all)
+        if any(posting is None for posting in postings):
+            return []
+
+        postings.sort(key=lambda posting: len(posting.ids))
+        smallest, others = postings[0], postings[1:]
+        result: List["Game"] = []
+        for game in smallest.games:
+            if all(game.id in posting.ids for posting in others):
+                result.append(game)
+                if limit and len(result) >= limit:
+                    break
+        return result
@@ -0,0 +1,58 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Optional
+
+from discord import app_commands
+
+logger = logging.getLogger(__name__)
+
+
+def command_tree_hash(tree: app_commands.CommandTree) -> str:
+    """Stable hash of the global command payload that `tree.sync()` would upload"""
+    payload = sorted((command.to_dict(tree) for command in tree.get_commands()), key=lambda c: (c.get("type", 1), c["name"]))
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class SyncState:
+    """Hash of the last command tree synced to Discord, kept across restarts.
+
+    Stored per application id, so pointing the same data directory at a
+    different bot still syncs. Also remembers how long that sync took, which
+    is the time saved whenever a sync can be skipped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.application_id: Optional[int] = None
+        self.hash: Optional[str] = None
+        self.sync_seconds = 0.0
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.application_id = data.get("application_id")
+            self.hash = data.get("hash")
+            self.sync_seconds = float(data.get("sync_seconds", 0.0))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read command sync state, will sync: %s", e)
+
+    def matches(self, application_id: int, digest: str) -> bool:
+        return self.application_id == application_id and self.hash == digest
+
+    def save(self, application_id: int, digest: str, sync_seconds: float):
+        self.application_id = application_id
+        self.hash = digest
+        self.sync_seconds = sync_seconds
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"application_id": application_id, "hash": digest, "sync_seconds": sync_seconds}, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional
+
+
+class DetailEntry:
+    """One cached /game record plus the validators needed to revalidate it"""
+
+    __slots__ = ("game_id", "data", "etag", "last_modified", "expires_at")
+
+    def __init__(self, game_id: int, data: Dict, etag: Optional[str], last_modified: Optional[str], expires_at: float):
+        self.game_id = game_id
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+
+class DetailCache:
+    """SQLite-backed cache for game detail records that survives restarts.
+
+    Each entry has its own expiry; once it passes, the entry is revalidated
+    with a conditional request instead of being thrown away. The table is
+    kept under `max_entries` by evicting the least recently read rows.
+    Read times are kept in memory and written in batches by `flush()`, so a
+    cache hit never waits on a disk write.
+    """
+
+    def __init__(self, path: str, ttl: float = 86400, max_entries: int = 2000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._db: Optional[sqlite3.Connection] = None
+        # Read times not yet written, and the number of rows in the table
+        self._accessed: Dict[int, float] = {}
+        self._count = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # A cache can lose its last few writes in a power cut; don't sync the disk on every commit
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS game_details (
+                    game_id INTEGER PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_details_accessed ON game_details (accessed_at)")
+            self._db.commit()
+            self._count = self._db.execute("SELECT COUNT(*) FROM game_details").fetchone()[0]
+        return self._db
+
+    def _write_accessed(self, db: sqlite3.Connection):
+        db.executemany(
+            "UPDATE game_details SET accessed_at = ? WHERE game_id = ?",
+            [(accessed_at, game_id) for game_id, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def flush(self) -> int:
+        """Write pending read times in one transaction; returns how many were written"""
+        if not self._accessed:
+            return 0
+        written = len(self._accessed)
+        db = self._connect()
+        with db:
+            self._write_accessed(db)
+        return written
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def get(self, game_id: int) -> Optional[DetailEntry]:
+        """Return the cached entry (fresh or not), or None"""
+        db = self._connect()
+        row = db.execute(
+            "SELECT body, etag, last_modified, expires_at FROM game_details WHERE game_id = ?",
+            (game_id,),
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._accessed[game_id] = time.time()
+        body, etag, last_modified, expires_at = row
+        return DetailEntry(game_id, json.loads(body), etag, last_modified, expires_at)
+
+    def set(self, game_id: int, data: Dict, etag: str = None, last_modified: str = None, max_age: float = None):
+        """Store a record with its validators and evict old rows past the size bound"""
+        now = time.time()
+        expires_at = now + (max_age if max_age is not None else self.ttl)
+        db = self._connect()
+        self._accessed.pop(game_id, None)
+        exists = db.execute("SELECT 1 FROM game_details WHERE game_id = ?", (game_id,)).fetchone()
+        db.execute(
+            """INSERT OR REPLACE INTO game_details
+               (game_id, body, etag, last_modified, expires_at, accessed_at)
+               VALUES (?, ?, ?, ?, ?, ?)""",
+            (game_id, json.dumps(data), etag, last_modified, expires_at, now),
+        )
+        if not exists:
+            self._count += 1
+        if self._count > self.max_entries:
+            # Eviction goes by read time, so write the pending ones first
+            self._write_accessed(db)
+            evicted = db.execute(
+                """DELETE FROM game_details WHERE game_id IN (
+                       SELECT game_id FROM game_details ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                   )""",
+                (self.max_entries,),
+            ).rowcount
+            self._count -= evicted
+        db.commit()
+
+    def touch(self, game_id: int, etag: str = None, last_modified: str = None, max_age: float = None):
+        """Mark an entry fresh again after a 304 Not Modified"""
+        expires_at = time.time() + (max_age if max_age is not None else self.ttl)
+        db = self._connect()
+        db.execute(
+            """UPDATE game_details SET expires_at = ?,
+                   etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)
+               WHERE game_id = ?""",
+            (expires_at, etag, last_modified, game_id),
+        )
+        db.commit()
+
+    def expire(self, game_ids: Iterable[int]):
+        """Force revalidation of entries whose catalog record changed"""
+        db = self._connect()
+        db.executemany("UPDATE game_details SET expires_at = 0 WHERE game_id = ?", [(game_id,) for game_id in game_ids])
+        db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        self._connect()
+        return {"entries": self._count, "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,55 @@
+import hashlib
+import json
+from typing import TYPE_CHECKING, Dict, Iterable, List
+
+if TYPE_CHECKING:
+    from utils.api import Game
+
+
+def fingerprint(record: "Game") -> int:
+    """Stable 64-bit fingerprint of a catalog record's contents"""
+    payload = json.dumps(record.to_dict(), sort_keys=True, separators=(",", ":")).encode()
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "big")
+
+
+class CatalogDiff:
+    """Games added, changed and removed between two catalog snapshots"""
+
+    __slots__ = ("added", "changed", "removed", "snapshot")
+
+    def __init__(self, added: List["Game"] = None, changed: List["Game"] = None, removed: List[int] = None, snapshot: Dict[int, int] = None):
+        self.added = added or []
+        self.changed = changed or []
+        self.removed = removed or []
+        self.snapshot = snapshot or {}
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self) -> str:
+        return f"<CatalogDiff added={len(self.added)} changed={len(self.changed)} removed={len(self.removed)}>"
+
+
+def diff_catalog(previous: Dict[int, int], records: Iterable["Game"]) -> CatalogDiff:
+    """Compare records against a previous {id: fingerprint} snapshot in one pass.
+
+    The returned diff carries the new snapshot to pass in next time.
+    """
+    result = CatalogDiff()
+    snapshot = result.snapshot
+
+    for record in records:
+        game_id = record.id
+        fp = fingerprint(record)
+        snapshot[game_id] = fp
+
+        old_fp = previous.get(game_id)
+        if old_fp is None:
+            result.added.append(record)
+        elif old_fp != fp:
+            result.changed.append(record)
+
+    # Every previous id either appears in the new snapshot or was removed
+    if len(snapshot) - len(result.added) != len(previous):
+        result.removed = [game_id for game_id in previous if game_id not in snapshot]
+    return result
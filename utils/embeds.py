@@ -0,0 +1,151 @@
+import discord
+from typing import Callable, Dict, Iterable, Tuple
+from utils.api import Game
+from utils.cache import TTLCache
+from utils.diff import CatalogDiff
+
+Field = Tuple[str, str]
+
+
+def _clone(payload: Dict) -> Dict:
+    """Copy an embed payload deep enough that discord.Embed can't mutate the cached one"""
+    clone = dict(payload)
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            clone[key] = dict(value)
+        elif isinstance(value, list):
+            clone[key] = [dict(item) for item in value]
+    return clone
+
+
+def _shorten(text: str, length: int) -> str:
+    return text[:length] + "..." if len(text) > length else text
+
+
+class EmbedRenderer:
+    """Shared, memoized formatting for per-game embed fields and embeds.
+
+    Rendered output is cached per (game id, layout), so a game shown in many
+    guilds or commands is formatted once. Entries are dropped when a game
+    changes: `on_catalog_diff` for catalog records, `on_detail_changed` for
+    detail records.
+    """
+
+    def __init__(self, max_entries: int = 2048):
+        self._cache = TTLCache(ttl=float("inf"), max_entries=max_entries)
+        self._keys_by_game: Dict[int, set] = {}
+
+    def _render(self, game: Game, layout: str, build: Callable[[Game], object]):
+        game_id = game.id
+        key = (game_id, layout)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        rendered = build(game)
+        self._cache.set(key, rendered)
+        self._keys_by_game.setdefault(game_id, set()).add(key)
+        return rendered
+
+    def invalidate(self, game_ids: Iterable[int]):
+        for game_id in game_ids:
+            for key in self._keys_by_game.pop(game_id, ()):
+                self._cache.invalidate(key)
+
+    def on_catalog_diff(self, diff: CatalogDiff):
+        """Catalog listener: forget renders of games that changed or disappeared"""
+        self.invalidate([game.id for game in diff.changed] + diff.removed)
+
+    def on_detail_changed(self, game_id: int):
+        """Detail listener: a game's detail record was replaced upstream"""
+        self.invalidate([game_id])
+
+    def stats(self) -> Dict[str, float]:
+        return self._cache.stats()
+
+    # Fields shared by list-style embeds (caller adds numbering to the name)
+
+    def news_field(self, game: Game) -> Field:
+        """Genre/platform, short description and play link (/latestnews)"""
+        def build(game: Game) -> Field:
+            url = game.game_url or ""
+            short_desc = game.short_description or ""
+            value = f"**Genre:** {game.genre or 'Unknown'} | **Platform:** {game.platform or 'PC'}"
+            if short_desc:
+                value += f"\n{_shorten(short_desc, 80)}"
+            if url:
+                value += f"\n[🎮 Play Now]({url})"
+            return game.title or "Unknown Game", value
+        return self._render(game, "news", build)
+
+    def list_field(self, game: Game) -> Field:
+        """Genre/platform/ID line and play link (/searchgame, /topgames)"""
+        def build(game: Game) -> Field:
+            url = game.game_url or ""
+            value = (
+                f"**Genre:** {game.genre or 'Unknown'} | **Platform:** {game.platform or 'PC'} "
+                f"| **ID:** {game.id}"
+            )
+            if url:
+                value += f"\n[🎮 Play Now]({url})"
+            return game.title or "Unknown", value
+        return self._render(game, "list", build)
+
+    def alert_field(self, game: Game) -> Field:
+        """Short description and play link for auto news alerts"""
+        def build(game: Game) -> Field:
+            url = game.game_url or ""
+            value = _shorten(game.short_description or "No description available", 100)
+            if url:
+                value += f"\n[🔗 Play Now]({url})"
+            return f"🎮 {game.title or 'Unknown Game'}", value
+        return self._render(game, "alert", build)
+
+    # Whole single-game embeds
+
+    def detail_embed(self, game: Game) -> discord.Embed:
+        """Full /gameinfo embed for a game detail record"""
+        def build(game: Game) -> Dict:
+            game_url = game.game_url or ""
+            thumbnail = game.thumbnail or ""
+            embed = discord.Embed(
+                title=f"🎮 {game.title or 'Unknown Game'}",
+                description=_shorten(game.description or "No description available", 500),
+                color=discord.Color.blue(),
+                url=game_url if game_url else None
+            )
+            embed.add_field(name="🎯 Genre", value=game.genre or "Unknown", inline=True)
+            embed.add_field(name="💻 Platform", value=game.platform or "PC", inline=True)
+            embed.add_field(name="📅 Release Date", value=game.release_date or "Unknown", inline=True)
+            embed.add_field(name="🏢 Publisher", value=game.publisher or "Unknown", inline=True)
+            embed.add_field(name="👨‍💻 Developer", value=game.developer or "Unknown", inline=True)
+            embed.add_field(name="🆔 Game ID", value=str(game.id), inline=True)
+            if thumbnail:
+                embed.set_thumbnail(url=thumbnail)
+            if game_url:
+                embed.add_field(name="🔗 Play Now", value=f"[Click here to play]({game_url})", inline=False)
+            embed.set_footer(text="Data from MMOBomb API")
+            return embed.to_dict()
+        return discord.Embed.from_dict(_clone(self._render(game, "detail", build)))
+
+    def random_embed(self, game: Game) -> discord.Embed:
+        """/randomgame embed; the colour is picked fresh each time"""
+        def build(game: Game) -> Dict:
+            url = game.game_url or ""
+            thumbnail = game.thumbnail or ""
+            embed = discord.Embed(
+                title=f"🎲 Random Game: {game.title or 'Unknown Game'}",
+                description=_shorten(game.short_description or "No description available", 300),
+            )
+            embed.add_field(name="🎯 Genre", value=game.genre or "Unknown", inline=True)
+            embed.add_field(name="💻 Platform", value=game.platform or "PC", inline=True)
+            embed.add_field(name="🆔 Game ID", value=str(game.id), inline=True)
+            if thumbnail:
+                embed.set_thumbnail(url=thumbnail)
+            if url:
+                embed.add_field(name="🔗 Play Now", value=f"[Click here to play]({url})", inline=False)
+            embed.set_footer(text="💡 Use /gameinfo to get more details about this game!")
+            return embed.to_dict()
+        embed = discord.Embed.from_dict(_clone(self._render(game, "random", build)))
+        embed.color = discord.Color.random()
+        return embed
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+class RateLimiter:
+    """Token bucket shared by all sends in a fan-out.
+
+    discord.py already waits out per-route 429s, but hundreds of channels each
+    being their own route still add up against the global request limit, so
+    sends are paced to stay under it instead of bouncing off it.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class FanoutReport:
+    """Delivery results for one fan-out run"""
+
+    def __init__(self):
+        self.delivered = 0
+        self.failures: Dict[Hashable, str] = {}
+        self.latencies: List[float] = []
+        self.duration = 0.0
+
+    @property
+    def failed(self) -> int:
+        return len(self.failures)
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+    @classmethod
+    def combine(cls, reports: Iterable["FanoutReport"]) -> "FanoutReport":
+        """One report for fan-outs that ran side by side"""
+        combined = cls()
+        for report in reports:
+            combined.delivered += report.delivered
+            combined.failures.update(report.failures)
+            combined.latencies.extend(report.latencies)
+            combined.duration = max(combined.duration, report.duration)
+        return combined
+
+    def summary(self) -> str:
+        reasons = Counter(self.failures.values())
+        text = (
+            f"{self.delivered} delivered, {self.failed} failed in {self.duration:.2f}s "
+            f"(p50 {self.percentile(50) * 1000:.0f}ms, p95 {self.percentile(95) * 1000:.0f}ms)"
+        )
+        if reasons:
+            text += " • " + ", ".join(f"{reason}: {count}" for reason, count in reasons.most_common())
+        return text
+
+
+async def fan_out(
+    targets: Iterable[Hashable],
+    send: Callable[[Hashable], Awaitable],
+    concurrency: int = 10,
+    rate: float = 40.0,
+    limiter: Optional[RateLimiter] = None,
+) -> FanoutReport:
+    """Call `send(target)` for every target with bounded concurrency and a shared rate limit.
+
+    Pass a `limiter` to share one rate limit between fan-outs running side by side.
+    """
+    report = FanoutReport()
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = limiter or RateLimiter(rate)
+    started = time.monotonic()
+
+    async def deliver(target: Hashable):
+        async with semaphore:
+            await limiter.acquire()
+            sent_at = time.monotonic()
+            try:
+                await send(target)
+            except Exception as e:
+                report.failures[target] = type(e).__name__
+            else:
+                report.delivered += 1
+                report.latencies.append(time.monotonic() - sent_at)
+
+    await asyncio.gather(*(deliver(target) for target in targets))
+    report.duration = time.monotonic() - started
+    return report
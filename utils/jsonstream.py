@@ -0,0 +1,96 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonArrayStream:
+    """Incremental decoder for a top-level JSON array.
+
+    Feed it the response body chunk by chunk and it returns each array
+    element as soon as the element is complete, so callers can build records
+    while the download is still running and stop reading once they have
+    enough. Anything other than an array (e.g. MMOBomb's
+    {"status": 0, ...} message) yields no elements.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"  # start -> first/value <-> separator -> done, or not_array
+        self.received = 0
+
+    @property
+    def is_array(self) -> bool:
+        return self._state != "not_array"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add bytes; returns the elements completed by them"""
+        self.received += len(chunk)
+        if self._state in ("done", "not_array"):
+            return []
+        self._buffer += self._utf8.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body; raises ValueError if the array was cut off"""
+        self._buffer += self._utf8.decode(b"", final=True)
+        items = self._drain(final=True)
+        if self._state not in ("done", "not_array"):
+            raise ValueError("truncated JSON array")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        pos = 0
+        end = len(buffer)
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos >= end:
+                break
+            char = buffer[pos]
+
+            if self._state == "start":
+                if char != "[":
+                    self._state = "not_array"
+                    pos = end
+                    break
+                self._state = "first"
+                pos += 1
+            elif self._state == "separator":
+                if char == ",":
+                    self._state = "value"
+                    pos += 1
+                elif char == "]":
+                    self._state = "done"
+                    pos += 1
+                    break
+                else:
+                    raise ValueError(f"expected ',' or ']' in JSON array, got {char!r}")
+            elif self._state in ("first", "value"):
+                if char == "]" and self._state == "first":
+                    self._state = "done"
+                    pos += 1
+                    break
+                try:
+                    item, item_end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # element not complete yet
+                if char not in "{[\"" and not final and (item_end == end or buffer[item_end] not in ",] \t\n\r"):
+                    break  # a number or literal is only complete once a delimiter follows it
+                items.append(item)
+                pos = item_end
+                self._state = "separator"
+            else:
+                pos = end
+                break
+
+        self._buffer = buffer[pos:]
+        return items
@@ -0,0 +1,96 @@
+import logging
+import logging.handlers
+import os
+import queue
+import time
+from typing import Dict, List, Optional, Tuple
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Identical warnings/errors allowed per window before the rest are only counted
+LOG_ERROR_BURST = int(os.getenv("LOG_ERROR_BURST", "5"))
+LOG_ERROR_WINDOW = float(os.getenv("LOG_ERROR_WINDOW", "60"))
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is a structured field
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """Standard log line followed by the record's structured fields as key=value pairs"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = " ".join(f"{key}={value}" for key, value in record.__dict__.items() if key not in _RESERVED)
+        return f"{line} | {fields}" if fields else line
+
+
+class RepeatFilter(logging.Filter):
+    """Rate-limits repeated warnings and errors.
+
+    Records are grouped by logger, level and message template (the unformatted
+    `msg`, so "Request error: %s" is one group whatever the exception). The
+    first `burst` records of a group per window pass; the rest are dropped
+    before they reach the queue, and the next record that passes carries a
+    `suppressed` count.
+    """
+
+    def __init__(self, burst: int = LOG_ERROR_BURST, window: float = LOG_ERROR_WINDOW):
+        super().__init__()
+        self.burst = burst
+        self.window = window
+        self._groups: Dict[Tuple, List] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+
+        now = time.monotonic()
+        key = (record.name, record.levelno, record.msg)
+        group = self._groups.get(key)
+        if group is None or now - group[0] >= self.window:
+            if group is not None and group[1] > self.burst:
+                record.suppressed = group[1] - self.burst
+            if len(self._groups) > 1024:
+                self._groups = {k: g for k, g in self._groups.items() if now - g[0] < self.window}
+            self._groups[key] = [now, 1]
+            return True
+
+        group[1] += 1
+        return group[1] <= self.burst
+
+
+def setup_logging(level: str = LOG_LEVEL) -> logging.handlers.QueueListener:
+    """Route all logging through a queue to a background writer thread.
+
+    Log calls on the event loop only enqueue the record; formatting and the
+    blocking write to stderr happen on the listener thread.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    writer = logging.StreamHandler()
+    writer.setFormatter(StructuredFormatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.addFilter(RepeatFilter())
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, writer)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Flush queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,186 @@
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Dict, Iterable, List, Set, Tuple
+
+import discord
+
+
+def _can_see(channel: discord.abc.GuildChannel, member: discord.Member) -> bool:
+    return channel.permissions_for(member).read_messages
+
+
+def _affects_visibility(before: discord.Permissions, after: discord.Permissions) -> bool:
+    return before.read_messages != after.read_messages or before.administrator != after.administrator
+
+
+# Gateway events hand over the already updated cache objects. These briefly put
+# the old state back (synchronously, so nothing else runs meanwhile) to check
+# what members could see before the event.
+
+@contextmanager
+def _old_role_permissions(before: discord.Role, after: discord.Role):
+    current = after._permissions
+    after._permissions = before._permissions
+    try:
+        yield
+    finally:
+        after._permissions = current
+
+
+@contextmanager
+def _deleted_role(role: discord.Role):
+    role.guild._add_role(role)
+    try:
+        yield
+    finally:
+        role.guild._remove_role(role.id)
+
+
+@contextmanager
+def _old_owner(before: discord.Guild, after: discord.Guild):
+    current = after.owner_id
+    after.owner_id = before.owner_id
+    try:
+        yield
+    finally:
+        after.owner_id = current
+
+
+class ChannelMemberCounts:
+    """Humans and bots that can see each text channel, per guild.
+
+    `TextChannel.members` re-checks permissions for every member on every
+    call. Here each guild is counted once, on the first query, and then kept
+    current from gateway events in O(channels) per member event or O(members)
+    per channel overwrite change. Role permission edits and role deletes
+    re-check only the members holding that role (everyone for @everyone), and
+    an ownership change only the old and new owner. `invalidate` still forces
+    a full recount on the guild's next query.
+    """
+
+    def __init__(self):
+        # guild id -> channel id -> [humans, bots]
+        self._guilds: Dict[int, Dict[int, List[int]]] = {}
+        self._stale: Set[int] = set()
+        self.recounts = 0
+
+    def _ready(self, guild: discord.Guild) -> bool:
+        return guild.id in self._guilds and guild.id not in self._stale
+
+    def counts(self, channel: discord.abc.GuildChannel) -> Tuple[int, int]:
+        """(humans, bots) that can see a channel"""
+        guild = channel.guild
+        if not self._ready(guild):
+            self.recount(guild)
+        entry = self._guilds[guild.id].get(channel.id)
+        if entry is None:
+            entry = self._count_channel(channel)
+        return entry[0], entry[1]
+
+    def recount(self, guild: discord.Guild):
+        """Full O(channels x members) count of a guild"""
+        text_channels = guild.text_channels
+        channels = {channel.id: [0, 0] for channel in text_channels}
+        for member in guild.members:
+            slot = 1 if member.bot else 0
+            for channel in text_channels:
+                if _can_see(channel, member):
+                    channels[channel.id][slot] += 1
+        self._guilds[guild.id] = channels
+        self._stale.discard(guild.id)
+        self.recounts += 1
+
+    def _count_channel(self, channel: discord.abc.GuildChannel) -> List[int]:
+        entry = [0, 0]
+        for member in channel.guild.members:
+            if _can_see(channel, member):
+                entry[1 if member.bot else 0] += 1
+        self._guilds[channel.guild.id][channel.id] = entry
+        return entry
+
+    def _apply(self, member: discord.Member, channels: Iterable[discord.abc.GuildChannel], delta: int):
+        counts = self._guilds[member.guild.id]
+        slot = 1 if member.bot else 0
+        for channel in channels:
+            entry = counts.get(channel.id)
+            if entry is not None:
+                entry[slot] += delta
+
+    # Gateway events
+
+    def member_joined(self, member: discord.Member):
+        if self._ready(member.guild):
+            self._apply(member, (ch for ch in member.guild.text_channels if _can_see(ch, member)), 1)
+
+    def member_left(self, member: discord.Member):
+        if self._ready(member.guild):
+            self._apply(member, (ch for ch in member.guild.text_channels if _can_see(ch, member)), -1)
+
+    def member_updated(self, before: discord.Member, after: discord.Member):
+        if not self._ready(after.guild) or {r.id for r in before.roles} == {r.id for r in after.roles}:
+            return
+        for channel in after.guild.text_channels:
+            change = _can_see(channel, after) - _can_see(channel, before)
+            if change:
+                self._apply(after, (channel,), change)
+
+    def _reapply(self, guild: discord.Guild, members: Iterable[discord.Member], old_state: Callable[[], ContextManager]):
+        """Apply count changes for members whose visibility may have changed.
+
+        `old_state()` temporarily restores the guild as it was before the
+        event, so each member is checked before and after.
+        """
+        members = list(members)
+        channels = guild.text_channels
+        with old_state():
+            before = [bytes(_can_see(channel, member) for channel in channels) for member in members]
+        for member, seen in zip(members, before):
+            for channel, was in zip(channels, seen):
+                change = _can_see(channel, member) - was
+                if change:
+                    self._apply(member, (channel,), change)
+
+    def role_updated(self, before: discord.Role, after: discord.Role):
+        if self._ready(after.guild) and _affects_visibility(before.permissions, after.permissions):
+            self._reapply(after.guild, after.members, lambda: _old_role_permissions(before, after))
+
+    def role_deleted(self, role: discord.Role):
+        """Members keep the deleted role's id, but it no longer grants them anything"""
+        if self._ready(role.guild):
+            self._reapply(role.guild, role.members, lambda: _deleted_role(role))
+
+    def owner_changed(self, before: discord.Guild, after: discord.Guild):
+        if not self._ready(after):
+            return
+        owners = (after.get_member(owner_id) for owner_id in {before.owner_id, after.owner_id})
+        self._reapply(after, [member for member in owners if member is not None], lambda: _old_owner(before, after))
+
+    def channel_changed(self, channel: discord.abc.GuildChannel):
+        """Channel created or its overwrites changed: count just that channel again"""
+        if self._ready(channel.guild) and isinstance(channel, discord.TextChannel):
+            self._count_channel(channel)
+
+    def channel_deleted(self, channel: discord.abc.GuildChannel):
+        counts = self._guilds.get(channel.guild.id)
+        if counts is not None:
+            counts.pop(channel.id, None)
+
+    def invalidate(self, guild: discord.Guild):
+        """Recount the guild from scratch on its next query"""
+        if guild.id in self._guilds:
+            self._stale.add(guild.id)
+
+    def forget(self, guild_id: int):
+        self._guilds.pop(guild_id, None)
+        self._stale.discard(guild_id)
+
+    def clear(self):
+        self._guilds.clear()
+        self._stale.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "guilds": len(self._guilds),
+            "channels": sum(len(channels) for channels in self._guilds.values()),
+            "stale": len(self._stale),
+            "recounts": self.recounts,
+        }
@@ -0,0 +1,162 @@
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import discord
+
+PAGE_SESSION_TTL = float(os.getenv("PAGE_SESSION_TTL", "300"))
+PAGE_SESSION_LIMIT = int(os.getenv("PAGE_SESSION_LIMIT", "500"))
+# Results kept per session; anything past this isn't reachable by paging.
+# Discord's per-guild channel limit, so /list_channels always fits.
+PAGE_MAX_RESULTS = 500
+
+# (items on the page, index of its first item, page number, page count) -> embed
+PageRenderer = Callable[[Sequence, int, int, int], discord.Embed]
+
+
+class PageSessions:
+    """Result lists behind paginated messages, so page turns don't recompute them.
+
+    Bounded by session count and by results per session; a session expires
+    PAGE_SESSION_TTL seconds after its last page turn. Expired sessions are
+    evicted on every access, and when their view times out.
+    """
+
+    def __init__(self, ttl: float = PAGE_SESSION_TTL, max_sessions: int = PAGE_SESSION_LIMIT, max_items: int = PAGE_MAX_RESULTS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_items = max_items
+        # Ordered by expiry, since every access moves a session to the end with a new expiry
+        self._sessions: "OrderedDict[int, Tuple[float, Tuple]]" = OrderedDict()
+        self.page_turns = 0
+        self.evicted = 0
+
+    def _evict(self, now: float):
+        while self._sessions:
+            session_id, (expires_at, _) = next(iter(self._sessions.items()))
+            if expires_at > now and len(self._sessions) <= self.max_sessions:
+                break
+            self._sessions.popitem(last=False)
+            self.evicted += 1
+
+    def create(self, session_id: int, items: Sequence) -> Tuple:
+        now = time.monotonic()
+        stored = tuple(items[:self.max_items])
+        self._sessions[session_id] = (now + self.ttl, stored)
+        self._sessions.move_to_end(session_id)
+        self._evict(now)
+        return stored
+
+    def get(self, session_id: int) -> Optional[Tuple]:
+        now = time.monotonic()
+        self._evict(now)
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        self._sessions[session_id] = (now + self.ttl, entry[1])
+        self._sessions.move_to_end(session_id)
+        self.page_turns += 1
+        return entry[1]
+
+    def drop(self, session_id: int):
+        self._sessions.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._sessions),
+            "results": sum(len(items) for _, items in self._sessions.values()),
+            "page_turns": self.page_turns,
+            "evicted": self.evicted,
+        }
+
+
+class Paginator(discord.ui.View):
+    """Previous/next buttons over a PageSessions entry"""
+
+    def __init__(self, sessions: PageSessions, session_id: int, owner_id: int, render: PageRenderer, page_size: int, total: int):
+        super().__init__(timeout=sessions.ttl)
+        self.sessions = sessions
+        self.session_id = session_id
+        self.owner_id = owner_id
+        self.render = render
+        self.page_size = page_size
+        self.pages = max(1, math.ceil(total / page_size))
+        self.page = 0
+        self.message: Optional[discord.Message] = None
+        self._update_buttons()
+
+    def page_embed(self, items: Sequence) -> discord.Embed:
+        start = self.page * self.page_size
+        return self.render(items[start:start + self.page_size], start, self.page, self.pages)
+
+    def _update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.pages - 1
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("❌ Only the person who ran the command can turn pages.", ephemeral=True)
+            return False
+        return True
+
+    async def _turn(self, interaction: discord.Interaction, page: int):
+        items = self.sessions.get(self.session_id)
+        if items is None:
+            self.stop()
+            await interaction.response.edit_message(view=None)
+            await interaction.followup.send("⌛ These results expired, run the command again.", ephemeral=True)
+            return
+        self.page = max(0, min(page, self.pages - 1))
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.page_embed(items), view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._turn(interaction, self.page - 1)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._turn(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        self.sessions.drop(self.session_id)
+        if self.message is not None:
+            try:
+                await self.message.edit(view=None)
+            except discord.HTTPException:
+                pass
+
+
+def page_footer(text: str, page: int, pages: int) -> str:
+    return f"{text} • Page {page + 1}/{pages}" if pages > 1 else text
+
+
+async def send_paginated(
+    interaction: discord.Interaction, sessions: PageSessions, items: Sequence, render: PageRenderer, page_size: int
+):
+    """Send the first page, with buttons and a cached result list if there is more than one page.
+
+    Replies through the followup webhook if the interaction was deferred.
+    """
+    deferred = interaction.response.is_done()
+    if len(items) <= page_size:
+        embed = render(items, 0, 0, 1)
+        if deferred:
+            await interaction.followup.send(embed=embed)
+        else:
+            await interaction.response.send_message(embed=embed)
+        return
+
+    stored = sessions.create(interaction.id, items)
+    view = Paginator(sessions, interaction.id, interaction.user.id, render, page_size, len(stored))
+    embed = view.page_embed(stored)
+    if deferred:
+        view.message = await interaction.followup.send(embed=embed, view=view, wait=True)
+    else:
+        await interaction.response.send_message(embed=embed, view=view)
+        view.message = await interaction.original_response()
@@ -0,0 +1,73 @@
+import random
+import time
+from typing import Optional
+
+
+class UpstreamError(Exception):
+    """MMOBomb could not be reached, timed out or kept returning server errors"""
+
+
+class RequestPolicy:
+    """Latency budget and retry settings for one upstream endpoint"""
+
+    __slots__ = ("attempt_timeout", "budget", "retries", "backoff", "max_backoff")
+
+    def __init__(self, attempt_timeout: float, budget: float, retries: int = 2, backoff: float = 0.25, max_backoff: float = 2.0):
+        self.attempt_timeout = attempt_timeout
+        self.budget = budget
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number `attempt + 1`"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Fails fast after repeated upstream failures.
+
+    Closed: requests pass. After `failure_threshold` consecutive failures the
+    circuit opens and requests are rejected without touching the network for
+    `reset_timeout` seconds. Then one trial request is let through
+    (half-open); success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_started: Optional[float] = None
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        # A trial that never reported back (e.g. cancelled) doesn't block the next one forever
+        now = time.monotonic()
+        if state == "half-open" and (self.trial_started is None or now - self.trial_started >= self.reset_timeout):
+            self.trial_started = now
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_started = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.times_opened += 1
+            self.opened_at = time.monotonic()
+            self.trial_started = None
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshJob:
+    """One dataset refreshed on its own jittered interval"""
+
+    def __init__(self, name: str, refresh: Callable[[], Awaitable], interval: float, jitter: float = 0.1):
+        self.name = name
+        self.refresh = refresh
+        self.interval = interval
+        self.jitter = jitter
+        self.runs = 0
+        self.failures = 0
+        self.last_run: Optional[float] = None
+        self.last_duration = 0.0
+
+    def next_delay(self) -> float:
+        spread = self.interval * self.jitter
+        return max(1.0, self.interval + random.uniform(-spread, spread))
+
+    async def run_once(self):
+        started = time.monotonic()
+        try:
+            await self.refresh()
+        except Exception as e:
+            self.failures += 1
+            logger.error("❌ Refresh '%s' failed: %s", self.name, e, extra={"job": self.name})
+        finally:
+            self.runs += 1
+            self.last_run = time.time()
+            self.last_duration = time.monotonic() - started
+
+
+
+class AdaptiveInterval:
+    """Poll interval that follows the observed change rate, within [floor, ceiling].
+
+    A poll that finds changes halves the interval, so clustered releases are
+    picked up quickly. Once `window` polls in a row found nothing, each further
+    quiet poll stretches it by half, so a quiet catalog is polled rarely.
+    """
+
+    def __init__(self, floor: float, ceiling: float, initial: float = None, window: int = 3):
+        self.floor = floor
+        self.ceiling = max(floor, ceiling)
+        self.current = min(self.ceiling, max(self.floor, initial if initial is not None else ceiling))
+        self.history: Deque[int] = deque(maxlen=window)
+
+    def record(self, changes: int) -> float:
+        """Record how many changes one poll found and return the next interval"""
+        self.history.append(changes)
+        if changes:
+            self.current = max(self.floor, self.current / 2)
+        elif len(self.history) == self.history.maxlen and not any(self.history):
+            self.current = min(self.ceiling, self.current * 1.5)
+        return self.current
+
+    def change_rate(self) -> float:
+        """Average changes per poll over the recent window"""
+        return sum(self.history) / len(self.history) if self.history else 0.0
+
+
+class RefreshScheduler:
+    """Warms datasets once at startup, then refreshes each on its own schedule.
+
+    Every job gets a random phase and jittered interval so refreshes don't
+    line up with each other (or with the auto news loop), and user commands
+    only ever read data that is already cached.
+    """
+
+    def __init__(self):
+        self.jobs: List[RefreshJob] = []
+        self._tasks: List[asyncio.Task] = []
+        self.warmed = False
+
+    def add(self, name: str, refresh: Callable[[], Awaitable], interval: float, jitter: float = 0.1):
+        self.jobs.append(RefreshJob(name, refresh, interval, jitter))
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def warm_up(self) -> float:
+        """Run every job once, concurrently; returns how long it took"""
+        started = time.monotonic()
+        await asyncio.gather(*(job.run_once() for job in self.jobs))
+        self.warmed = True
+        return time.monotonic() - started
+
+    def start(self):
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._loop(job)) for job in self.jobs]
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    async def _loop(self, job: RefreshJob):
+        # Random phase so jobs with equal intervals don't fire together
+        await asyncio.sleep(job.interval * random.uniform(0.5, 1.0))
+        while True:
+            await job.run_once()
+            await asyncio.sleep(job.next_delay())
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            job.name: {
+                "runs": job.runs,
+                "failures": job.failures,
+                "last_run": job.last_run,
+                "last_duration": job.last_duration,
+            }
+            for job in self.jobs
+        }
@@ -0,0 +1,265 @@
+import bisect
+import heapq
+import re
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+from utils.diff import CatalogDiff
+
+if TYPE_CHECKING:
+    from utils.api import Game
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Prefix postings are kept for the first few characters of each token only;
+# longer prefixes are confirmed against the token itself.
+MAX_PREFIX_LENGTH = 6
+# Minimum trigram similarity for a typo-tolerant (non-substring) match
+FUZZY_THRESHOLD = 0.45
+# How many prefix matches, and how many typo candidates, get full (trigram) scoring per requested result
+SCORED_CANDIDATES_PER_RESULT = 10
+FUZZY_CANDIDATES_PER_RESULT = 20
+# Trigrams in more than this share of titles are skipped when picking fuzzy candidates
+COMMON_TRIGRAM_SHARE = 0.1
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse anything that isn't a letter or digit into single spaces"""
+    return _NON_ALNUM.sub(" ", (text or "").lower()).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Character trigrams of each word, padded so word boundaries count"""
+    grams: Set[str] = set()
+    for token in text.split():
+        padded = f"  {token} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return grams
+
+
+class _Entry:
+    __slots__ = ("game", "title", "norm", "tokens", "grams")
+
+    def __init__(self, game: "Game", title: str):
+        self.game = game
+        self.title = title
+        self.norm = normalize(title)
+        self.tokens = self.norm.split()
+        self.grams = trigrams(self.norm)
+
+
+class SearchIndex:
+    """Title search index with prefix and trigram postings.
+
+    Built once from a catalog and updated incrementally with `update()` when
+    the catalog is refreshed, so queries never rescan every title.
+    """
+
+    def __init__(self, games: Iterable["Game"] = ()):
+        self._entries: Dict[int, _Entry] = {}
+        self._prefixes: Dict[str, Set[int]] = defaultdict(set)
+        self._trigrams: Dict[str, Set[int]] = defaultdict(set)
+        # Sorted (title, id) and (id string, id) lists for autocomplete, rebuilt on update
+        self._sorted_titles: List[Tuple[str, int]] = []
+        self._sorted_ids: List[Tuple[str, int]] = []
+        self._sorted_dirty = False
+        self.update(games)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _add(self, game_id: int, entry: _Entry):
+        self._entries[game_id] = entry
+        self._sorted_dirty = True
+        for token in entry.tokens:
+            for i in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                self._prefixes[token[:i]].add(game_id)
+        for gram in entry.grams:
+            self._trigrams[gram].add(game_id)
+
+    def _remove(self, game_id: int):
+        entry = self._entries.pop(game_id, None)
+        if entry is None:
+            return
+        self._sorted_dirty = True
+        for token in entry.tokens:
+            for i in range(1, min(len(token), MAX_PREFIX_LENGTH) + 1):
+                self._discard(self._prefixes, token[:i], game_id)
+        for gram in entry.grams:
+            self._discard(self._trigrams, gram, game_id)
+
+    @staticmethod
+    def _discard(postings: Dict[str, Set[int]], key: str, game_id: int):
+        ids = postings.get(key)
+        if ids is not None:
+            ids.discard(game_id)
+            if not ids:
+                del postings[key]
+
+    def _upsert(self, game: "Game") -> int:
+        """Index one game, re-tokenizing only if its title changed"""
+        game_id = game.id
+        title = game.title or ""
+
+        entry = self._entries.get(game_id)
+        if entry is not None and entry.title == title:
+            entry.game = game
+            return game_id
+        if entry is not None:
+            self._remove(game_id)
+        self._add(game_id, _Entry(game, title))
+        return game_id
+
+    def update(self, games: Iterable["Game"]):
+        """Sync the index with a full catalog, touching only added, renamed or removed games"""
+        seen: Set[int] = set()
+        for game in games:
+            seen.add(self._upsert(game))
+
+        for game_id in [gid for gid in self._entries if gid not in seen]:
+            self._remove(game_id)
+        self._ensure_sorted()
+
+    def apply_diff(self, diff: CatalogDiff):
+        """Apply a catalog delta without walking the rest of the catalog"""
+        for game in diff.added:
+            self._upsert(game)
+        for game in diff.changed:
+            self._upsert(game)
+        for game_id in diff.removed:
+            self._remove(game_id)
+        self._ensure_sorted()
+
+    def _prefix_candidates(self, tokens: List[str]) -> Set[int]:
+        """Ids whose titles have a word starting with every query token"""
+        postings = sorted(
+            (self._prefixes.get(token[:MAX_PREFIX_LENGTH], set()) for token in tokens),
+            key=len,
+        )
+        return set.intersection(*postings) if postings else set()
+
+    def _fuzzy_candidates(self, grams: Set[str], limit: int) -> Set[int]:
+        """Ids sharing the most trigrams with the query, enough to pass the fuzzy threshold.
+
+        Overlap is counted on the query's rarer trigrams only: common ones
+        (" s", "er ", ...) have postings in the thousands and barely tell
+        titles apart. Only the best few overlaps are returned so scoring stays
+        proportional to `limit`.
+        """
+        postings = sorted((self._trigrams.get(gram, set()) for gram in grams), key=len)
+        common = COMMON_TRIGRAM_SHARE * len(self._entries)
+        rare = [ids for ids in postings if len(ids) <= common] or postings[:3]
+        overlap: Counter = Counter()
+        for ids in rare:
+            overlap.update(ids)
+        min_shared = FUZZY_THRESHOLD * len(rare) / 2
+        best = heapq.nlargest(limit * FUZZY_CANDIDATES_PER_RESULT, overlap.items(), key=lambda item: item[1])
+        return {game_id for game_id, shared in best if shared >= min_shared}
+
+    def _score(self, entry: _Entry, norm: str, tokens: List[str], postings: List[Set[int]], grams: Set[str]) -> float:
+        score = 0.0
+        if norm in entry.norm:
+            score += 3.0
+            if entry.norm.startswith(norm):
+                score += 1.0
+            if entry.norm == norm:
+                score += 2.0
+
+        # A token hits if the title is in its prefix postings (confirmed for tokens longer than those)
+        game_id = entry.game.id
+        prefix_hits = sum(
+            1 for token, ids in zip(tokens, postings)
+            if game_id in ids and (len(token) <= MAX_PREFIX_LENGTH or any(t.startswith(token) for t in entry.tokens))
+        )
+        score += prefix_hits / len(tokens)
+
+        similarity = 2 * len(grams & entry.grams) / (len(grams) + len(entry.grams))
+        if score == 0 and similarity < FUZZY_THRESHOLD:
+            return 0.0
+        return score + similarity
+
+    def search(self, query: str, limit: int = 5) -> List["Game"]:
+        """Return up to `limit` games ranked by how well their titles match"""
+        norm = normalize(query)
+        if not norm:
+            return []
+        tokens = norm.split()
+        grams = trigrams(norm)
+
+        # Titles with a word starting with every query token (postings only cover the first
+        # few characters, so longer tokens are confirmed here). They all get the same
+        # prefix score, so they are ranked on exact/starts with/contains and length alone,
+        # and only the top slice is scored with trigram similarity.
+        matched = [self._entries[game_id] for game_id in self._prefix_candidates(tokens)]
+        long_tokens = [token for token in tokens if len(token) > MAX_PREFIX_LENGTH]
+        if long_tokens:
+            matched = [
+                entry for entry in matched
+                if all(any(t.startswith(token) for t in entry.tokens) for token in long_tokens)
+            ]
+        ranked = [
+            (
+                0 if entry.norm == norm else 1 if entry.norm.startswith(norm) else 2 if norm in entry.norm else 3,
+                len(entry.norm), entry.norm, entry.game.id,
+            )
+            for entry in matched
+        ]
+        candidates = {game_id for *_, game_id in heapq.nsmallest(limit * SCORED_CANDIDATES_PER_RESULT, ranked)}
+        # Only fall back to trigram lookups for typos
+        if len(matched) < limit:
+            candidates |= self._fuzzy_candidates(grams, limit)
+
+        postings = [self._prefixes.get(token[:MAX_PREFIX_LENGTH], set()) for token in tokens]
+        scored: List[Tuple[float, int, str, "Game"]] = []
+        for game_id in candidates:
+            entry = self._entries[game_id]
+            score = self._score(entry, norm, tokens, postings, grams)
+            if score > 0:
+                scored.append((-score, len(entry.norm), entry.norm, entry.game))
+
+        best = heapq.nsmallest(limit, scored, key=lambda item: item[:3])
+        return [game for _, _, _, game in best]
+
+    def _ensure_sorted(self):
+        if not self._sorted_dirty:
+            return
+        self._sorted_titles = sorted((entry.norm, game_id) for game_id, entry in self._entries.items())
+        self._sorted_ids = sorted((str(game_id), game_id) for game_id in self._entries)
+        self._sorted_dirty = False
+
+    @staticmethod
+    def _range(sorted_keys: List[Tuple[str, int]], prefix: str, limit: int) -> List[int]:
+        """Ids whose sort key starts with prefix, in order, via binary search"""
+        found: List[int] = []
+        start = bisect.bisect_left(sorted_keys, (prefix, -1))
+        for key, game_id in sorted_keys[start:start + limit]:
+            if not key.startswith(prefix):
+                break
+            found.append(game_id)
+        return found
+
+    def complete(self, text: str, limit: int = 25) -> List["Game"]:
+        """Fast autocomplete: id prefix, then title prefix, then word prefix matches.
+
+        Only binary searches and prefix postings are used, so this stays cheap
+        enough to run on every keystroke.
+        """
+        self._ensure_sorted()
+        raw = (text or "").strip()
+        norm = normalize(raw)
+
+        ids: List[int] = []
+        if raw.isdigit():
+            ids.extend(self._range(self._sorted_ids, raw, limit))
+        if len(ids) < limit:
+            ids.extend(self._range(self._sorted_titles, norm, limit))
+
+        if len(ids) < limit and norm:
+            taken = set(ids)
+            extra = self._prefix_candidates(norm.split()) - taken
+            ids.extend(heapq.nsmallest(
+                limit - len(ids), extra, key=lambda game_id: self._entries[game_id].norm
+            ))
+
+        unique = list(dict.fromkeys(ids))[:limit]
+        return [self._entries[game_id].game for game_id in unique]
@@ -0,0 +1,97 @@
+import bisect
+import logging
+import os
+import struct
+from array import array
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<qq")
+
+
+class SeenIds:
+    """Compact, persistent record of game ids that have already been announced.
+
+    Ids live in a sorted `array` (8 bytes each) with a parallel array of the
+    sequence number at which each id was first seen. Only the newest
+    `horizon` ids are kept, and the whole state is written to one small
+    binary file so it survives restarts. Because auto news sends the same
+    batch to every subscribed channel, this single state covers every guild.
+    """
+
+    def __init__(self, path: str, horizon: int = 5000):
+        self.path = path
+        self.horizon = horizon
+        self._ids = array("q")
+        self._seqs = array("q")
+        self._next_seq = 0
+        self._loaded = False
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._ids)
+
+    def __contains__(self, game_id: int) -> bool:
+        self._ensure_loaded()
+        i = bisect.bisect_left(self._ids, game_id)
+        return i < len(self._ids) and self._ids[i] == game_id
+
+    def highest(self) -> Optional[int]:
+        """Largest id recorded, if any (MMOBomb ids grow as games are added)"""
+        self._ensure_loaded()
+        return self._ids[-1] if self._ids else None
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "rb") as f:
+                next_seq, count = _HEADER.unpack(f.read(_HEADER.size))
+                ids, seqs = array("q"), array("q")
+                ids.fromfile(f, count)
+                seqs.fromfile(f, count)
+        except FileNotFoundError:
+            return
+        except (OSError, EOFError, struct.error) as e:
+            logger.warning("Could not read seen game ids, starting fresh: %s", e)
+            return
+        self._ids, self._seqs, self._next_seq = ids, seqs, next_seq
+
+    def add(self, game_ids: Iterable[int]) -> List[int]:
+        """Record ids as seen; returns the ones that were new, in input order"""
+        self._ensure_loaded()
+        added: List[int] = []
+        for game_id in game_ids:
+            i = bisect.bisect_left(self._ids, game_id)
+            if i < len(self._ids) and self._ids[i] == game_id:
+                continue
+            self._ids.insert(i, game_id)
+            self._seqs.insert(i, self._next_seq)
+            self._next_seq += 1
+            added.append(game_id)
+
+        if len(self._ids) > self.horizon:
+            self._trim()
+        return added
+
+    def _trim(self):
+        """Forget the oldest ids beyond the horizon"""
+        cutoff = sorted(self._seqs)[len(self._seqs) - self.horizon]
+        keep = [i for i, seq in enumerate(self._seqs) if seq >= cutoff]
+        self._ids = array("q", (self._ids[i] for i in keep))
+        self._seqs = array("q", (self._seqs[i] for i in keep))
+
+    def save(self):
+        """Atomically write the state to disk"""
+        self._ensure_loaded()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(self._next_seq, len(self._ids)))
+            self._ids.tofile(f)
+            self._seqs.tofile(f)
+        os.replace(tmp_path, self.path)
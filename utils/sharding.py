@@ -0,0 +1,102 @@
+from collections import deque
+from typing import Deque, Dict, List, Set
+
+import discord
+
+from utils.member_counts import ChannelMemberCounts
+
+# Auto news posts a disconnected shard keeps for when it is back
+PENDING_NEWS_LIMIT = 5
+
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    """Shard that receives a guild's gateway events (Discord's sharding formula)"""
+    return (guild_id >> 22) % shard_count
+
+
+class ShardedMemberCounts:
+    """One ChannelMemberCounts per shard, behind the same interface.
+
+    Gateway events for a guild only arrive on its shard, so each partition is
+    only touched by one shard, and a shard that re-identifies (rebuilding its
+    guild cache) only drops its own counts.
+    """
+
+    def __init__(self):
+        self.shards: Dict[int, ChannelMemberCounts] = {}
+
+    def shard(self, shard_id: int) -> ChannelMemberCounts:
+        counts = self.shards.get(shard_id)
+        if counts is None:
+            counts = self.shards[shard_id] = ChannelMemberCounts()
+        return counts
+
+    def _for(self, guild: discord.Guild) -> ChannelMemberCounts:
+        return self.shard(guild.shard_id)
+
+    def counts(self, channel: discord.abc.GuildChannel):
+        return self._for(channel.guild).counts(channel)
+
+    def member_joined(self, member: discord.Member):
+        self._for(member.guild).member_joined(member)
+
+    def member_left(self, member: discord.Member):
+        self._for(member.guild).member_left(member)
+
+    def member_updated(self, before: discord.Member, after: discord.Member):
+        self._for(after.guild).member_updated(before, after)
+
+    def role_updated(self, before: discord.Role, after: discord.Role):
+        self._for(after.guild).role_updated(before, after)
+
+    def role_deleted(self, role: discord.Role):
+        self._for(role.guild).role_deleted(role)
+
+    def owner_changed(self, before: discord.Guild, after: discord.Guild):
+        self._for(after).owner_changed(before, after)
+
+    def channel_changed(self, channel: discord.abc.GuildChannel):
+        self._for(channel.guild).channel_changed(channel)
+
+    def channel_deleted(self, channel: discord.abc.GuildChannel):
+        self._for(channel.guild).channel_deleted(channel)
+
+    def invalidate(self, guild: discord.Guild):
+        self._for(guild).invalidate(guild)
+
+    def forget(self, guild_id: int):
+        for counts in self.shards.values():
+            counts.forget(guild_id)
+
+    def reset_shard(self, shard_id: int):
+        """Drop a shard's counts; its guilds are recounted on their next query"""
+        if shard_id in self.shards:
+            self.shards[shard_id].clear()
+
+    def stats(self) -> Dict[str, int]:
+        totals = {"guilds": 0, "channels": 0, "stale": 0, "recounts": 0}
+        for counts in self.shards.values():
+            for key, value in counts.stats().items():
+                totals[key] += value
+        totals["shards"] = len(self.shards)
+        return totals
+
+
+class ShardTracker:
+    """Which of this process's shards are connected, and auto news they missed meanwhile"""
+
+    def __init__(self, pending_limit: int = PENDING_NEWS_LIMIT):
+        self.ready: Set[int] = set()
+        self.pending: Dict[int, Deque[discord.Embed]] = {}
+        self.pending_limit = pending_limit
+
+    def mark_ready(self, shard_id: int) -> List[discord.Embed]:
+        """Mark a shard connected; returns the posts it held while it wasn't"""
+        self.ready.add(shard_id)
+        return list(self.pending.pop(shard_id, ()))
+
+    def mark_down(self, shard_id: int):
+        self.ready.discard(shard_id)
+
+    def hold(self, shard_id: int, embed: discord.Embed):
+        self.pending.setdefault(shard_id, deque(maxlen=self.pending_limit)).append(embed)
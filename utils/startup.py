@@ -0,0 +1,47 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+# Report order; phases can overlap (the cache warms while the gateway connects)
+PHASES = ("import", "cog setup", "gateway connect", "cache warm", "tree sync")
+
+
+class StartupTimer:
+    """Durations of the startup phases and total restart-to-ready time"""
+
+    def __init__(self, started: Optional[float] = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.ready_after: Optional[float] = None
+        self._marks: Dict[str, float] = {}
+
+    def record(self, phase: str, seconds: float):
+        self.phases[phase] = seconds
+
+    def begin(self, phase: str):
+        """Start timing a phase that ends somewhere else (see `end`)"""
+        self._marks[phase] = time.perf_counter()
+
+    def end(self, phase: str):
+        started = self._marks.pop(phase, None)
+        if started is not None:
+            self.record(phase, time.perf_counter() - started)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        self.begin(phase)
+        try:
+            yield
+        finally:
+            self.end(phase)
+
+    def ready(self) -> float:
+        """Mark the bot ready; returns seconds since the process started"""
+        self.ready_after = time.perf_counter() - self.started
+        return self.ready_after
+
+    def summary(self) -> str:
+        parts = [f"{phase} {self.phases[phase]:.2f}s" for phase in PHASES if phase in self.phases]
+        if self.ready_after is not None:
+            parts.append(f"ready after {self.ready_after:.2f}s")
+        return " • ".join(parts)
@@ -0,0 +1,119 @@
+import os
+import sqlite3
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.sharding import shard_for_guild
+
+
+class SubscriptionStore:
+    """Per-guild auto news channels, kept in memory and persisted to SQLite.
+
+    Everything is loaded once at startup so lookups are plain dict reads.
+    Changes only mark the guild dirty; `flush()` writes all dirty guilds in
+    one transaction and is called periodically and on shutdown.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._channels: Dict[int, Set[int]] = {}
+        self._dirty: Set[int] = set()
+        self._db: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS subscriptions (
+                    guild_id INTEGER NOT NULL,
+                    channel_id INTEGER NOT NULL,
+                    PRIMARY KEY (guild_id, channel_id)
+                )"""
+            )
+            self._db.commit()
+        return self._db
+
+    def load(self):
+        """Read every subscription into memory"""
+        self._channels.clear()
+        for guild_id, channel_id in self._connect().execute("SELECT guild_id, channel_id FROM subscriptions"):
+            self._channels.setdefault(guild_id, set()).add(channel_id)
+        self._dirty.clear()
+
+    def channels_for(self, guild_id: int) -> Set[int]:
+        return self._channels.get(guild_id, set())
+
+    def add(self, guild_id: int, channel_id: int) -> bool:
+        """Subscribe a channel; returns False if it already was"""
+        channels = self._channels.setdefault(guild_id, set())
+        if channel_id in channels:
+            return False
+        channels.add(channel_id)
+        self._dirty.add(guild_id)
+        return True
+
+    def remove(self, guild_id: int, channel_id: int = None) -> int:
+        """Unsubscribe one channel, or the whole guild; returns how many were removed"""
+        channels = self._channels.get(guild_id)
+        if not channels:
+            return 0
+
+        if channel_id is None:
+            removed = len(channels)
+            channels.clear()
+        elif channel_id in channels:
+            removed = 1
+            channels.discard(channel_id)
+        else:
+            return 0
+
+        if not channels:
+            del self._channels[guild_id]
+        self._dirty.add(guild_id)
+        return removed
+
+    def guilds(self) -> Set[int]:
+        return set(self._channels)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """(guild_id, channel_id) for every subscription"""
+        for guild_id, channels in list(self._channels.items()):
+            for channel_id in list(channels):
+                yield guild_id, channel_id
+
+    def by_shard(self, shard_count: int) -> Dict[int, List[Tuple[int, int]]]:
+        """(guild_id, channel_id) subscriptions grouped by the shard that owns their guild"""
+        groups: Dict[int, List[Tuple[int, int]]] = {}
+        for guild_id, channels in self._channels.items():
+            groups.setdefault(shard_for_guild(guild_id, shard_count), []).extend(
+                (guild_id, channel_id) for channel_id in channels
+            )
+        return groups
+
+    def __len__(self) -> int:
+        return sum(len(channels) for channels in self._channels.values())
+
+    def flush(self) -> int:
+        """Write every dirty guild in one transaction; returns the number of guilds written"""
+        if not self._dirty:
+            return 0
+
+        dirty = list(self._dirty)
+        db = self._connect()
+        with db:
+            for guild_id in dirty:
+                db.execute("DELETE FROM subscriptions WHERE guild_id = ?", (guild_id,))
+                db.executemany(
+                    "INSERT INTO subscriptions (guild_id, channel_id) VALUES (?, ?)",
+                    [(guild_id, channel_id) for channel_id in self._channels.get(guild_id, ())],
+                )
+        self._dirty.difference_update(dirty)
+        return len(dirty)
+
+    def close(self):
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None